@@ -1,9 +1,16 @@
+import csv
+import io
 import json
 import logging
 import os
 import pkgutil
+import sys
+import time
+from collections.abc import MutableMapping
+from typing import Any, Callable, Iterator, TextIO
 
 from .DataValidation import DataValidation, ValidationError
+from .Profiling import record_import_stage
 
 from .hooks.Data import \
     after_load_game_file, \
@@ -46,24 +53,340 @@ class ManualFile:
         return contents
 
 
-game_table = ManualFile('game.json', dict).load() #dict
-item_table = convert_to_list(ManualFile('items.json', list).load(), 'data') #list
-location_table = convert_to_list(ManualFile('locations.json', list).load(), 'data') #list
-region_table = ManualFile('regions.json', dict).load() #dict
-category_table = ManualFile('categories.json', dict).load() #dict
-meta_table = ManualFile('meta.json', dict).load() #dict
+class ManualDataRecord(MutableMapping):
+    """An entry of a data table (like an item or a location), once it's loaded. Its usual fields are slots, with interned strings
+    and tuples instead of lists for tuple_fields, and anything else is kept in extra_fields.
+    The fields the data file leaves out are None, so the generation code reads them as attributes (location.requires is not None).
+    It can also be used like the dict it was made from, without the None fields, so hooks and the client can keep using
+    item["name"] or location.get("requires")."""
+    __slots__ = ("extra_fields",)
+    field_names: tuple[str, ...] = () # the __slots__ of the subclass, set by __init_subclass__
+    field_set: frozenset[str] = frozenset()
+    tuple_fields: frozenset[str] = frozenset()
+    default_fields: dict[str, Any] = {} # fields that are always there, even if the data file leaves them out
 
-# Removal of schemas in root of tables
-region_table.pop('$schema', '')
-category_table.pop('$schema', '')
+    def __init_subclass__(cls, **kwargs):
+        super().__init_subclass__(**kwargs)
+        cls.field_names = tuple(cls.__slots__)
+        cls.field_set = frozenset(cls.field_names)
 
-# hooks
-game_table = after_load_game_file(game_table)
-item_table = after_load_item_file(item_table)
-location_table = after_load_location_file(location_table)
-region_table = after_load_region_file(region_table)
-category_table = after_load_category_file(category_table)
-meta_table = after_load_meta_file(meta_table)
+    def __init__(self, data: dict):
+        self.extra_fields: dict|None = None
+        for key in self.field_names:
+            setattr(self, key, None)
+        for key, value in self.default_fields.items():
+            self[key] = value
+        for key, value in data.items():
+            self[key] = value
+
+    def __getitem__(self, key: str) -> Any:
+        if key in self.field_set:
+            value = getattr(self, key)
+            if value is None:
+                raise KeyError(key)
+            return value
+
+        if self.extra_fields is None:
+            raise KeyError(key)
+        return self.extra_fields[key]
+
+    def __setitem__(self, key: str, value: Any) -> None:
+        if key not in self.field_set:
+            if self.extra_fields is None:
+                self.extra_fields = {}
+            self.extra_fields[key] = value
+            return
+
+        if isinstance(value, str):
+            value = sys.intern(value)
+        elif key in self.tuple_fields and isinstance(value, list):
+            value = tuple(sys.intern(part) if isinstance(part, str) else part for part in value)
+        setattr(self, key, value)
+
+    def __delitem__(self, key: str) -> None:
+        if key in self.field_set:
+            if getattr(self, key) is None:
+                raise KeyError(key)
+            setattr(self, key, None)
+        elif self.extra_fields is None:
+            raise KeyError(key)
+        else:
+            del self.extra_fields[key]
+
+    def __contains__(self, key: object) -> bool:
+        if key in self.field_set:
+            return getattr(self, key) is not None
+        return self.extra_fields is not None and key in self.extra_fields
+
+    def __iter__(self) -> Iterator[str]:
+        for key in self.field_names:
+            if getattr(self, key) is not None:
+                yield key
+        if self.extra_fields is not None:
+            yield from self.extra_fields
+
+    def __len__(self) -> int:
+        return sum(1 for _ in self)
+
+    def __repr__(self) -> str:
+        return repr(dict(self))
+
+    # the same as the Mapping methods, but without going through exceptions for missing keys
+    def get(self, key: str, default: Any = None) -> Any:
+        if key in self.field_set:
+            value = getattr(self, key)
+            return default if value is None else value
+        return self.extra_fields.get(key, default) if self.extra_fields is not None else default
+
+    def copy(self) -> dict:
+        return dict(self)
+
+
+class ManualItemData(ManualDataRecord):
+    """An item of items.json (Items.py gives it its id), see ManualDataRecord"""
+    __slots__ = ("name", "id", "category", "count", "progression", "useful", "trap", "progression_skip_balancing",
+                 "early", "local", "local_early", "value")
+    tuple_fields = frozenset(["category"])
+    default_fields = {"category": ()}
+
+
+class ManualLocationData(ManualDataRecord):
+    """A location of locations.json (Locations.py gives it its id), see ManualDataRecord"""
+    __slots__ = ("name", "id", "region", "category", "requires", "victory", "place_item", "place_item_category",
+                 "dont_place_item", "dont_place_item_category", "prehint", "hint_entrance")
+    tuple_fields = frozenset(["category"])
+    default_fields = {"category": ()}
+
+
+def csv_list(value: str) -> list[str]:
+    """For CSV cells with several values separated by "; ", like categories. Repeated values share the same string."""
+    if value == "":
+        return []
+    return [sys.intern(part) for part in value.split("; ")]
+
+
+class ManualCSVFile:
+    """A data table in a CSV file (or a TSV file, if its name ends with .tsv), read one row at a time.
+    The path is relative to the apworld's folder and columns gives the function that converts the cells of each column,
+    the other columns are kept as strings."""
+    path: str
+    columns: dict[str, Callable[[str], Any]]
+
+    def __init__(self, path, columns=None):
+        self.path = path
+        self.columns = columns or {}
+        self.delimiter = "\t" if path.lower().endswith(".tsv") else ","
+
+    def open(self) -> TextIO:
+        # when the apworld is a folder the file is streamed from the disk, in a .apworld it's streamed out of the zip
+        full_path = os.path.join(os.path.dirname(__file__), self.path)
+        if os.path.isfile(full_path):
+            return open(full_path, "r", encoding="utf-8", newline="")
+
+        import zipfile
+        apworld = zipfile.ZipFile(__loader__.archive)
+        try:
+            # closing the wrapper closes the entry, the ZipFile itself is closed once the entry is
+            entry = apworld.open(__loader__.prefix + self.path.replace(os.sep, "/"))
+        finally:
+            apworld.close()
+        return io.TextIOWrapper(entry, encoding="utf-8", newline="")
+
+    def rows(self) -> Iterator[dict]:
+        with self.open() as file:
+            reader = csv.reader(file, delimiter=self.delimiter)
+            header = next(reader, None)
+            if header is None:
+                return
+
+            missing_columns = [column for column in self.columns if column not in header]
+            if missing_columns:
+                raise ValidationError(f"{self.path} is missing the column(s) {', '.join(missing_columns)}")
+
+            # the converter of each column is only looked up once, not for each cell
+            converters = [(sys.intern(column), self.columns.get(column)) for column in header]
+
+            for line_number, row in enumerate(reader, start=2):
+                if not row:
+                    continue
+
+                try:
+                    yield {column: convert(cell) if convert else cell for (column, convert), cell in zip(converters, row)}
+                except ValueError as e:
+                    raise ValidationError(f"{self.path}, line {line_number}: {e}") from e
+
+
+def load_tables() -> dict:
+    """Loads the data files and runs them through the data hooks"""
+    stage_start = time.perf_counter()
+    game_table = ManualFile('game.json', dict).load() #dict
+    item_table = convert_to_list(ManualFile('items.json', list).load(), 'data') #list
+    location_table = convert_to_list(ManualFile('locations.json', list).load(), 'data') #list
+    region_table = ManualFile('regions.json', dict).load() #dict
+    category_table = ManualFile('categories.json', dict).load() #dict
+    meta_table = ManualFile('meta.json', dict).load() #dict
+
+    # Removal of schemas in root of tables
+    region_table.pop('$schema', '')
+    category_table.pop('$schema', '')
+    record_import_stage("Data.py: parse the data files", stage_start)
+
+    # hooks
+    stage_start = time.perf_counter()
+    tables = {
+        "game_table": after_load_game_file(game_table),
+        "item_table": after_load_item_file(item_table),
+        "location_table": after_load_location_file(location_table),
+        "region_table": after_load_region_file(region_table),
+        "category_table": after_load_category_file(category_table),
+        "meta_table": after_load_meta_file(meta_table),
+    }
+    record_import_stage("hooks/Data.py: after_load hooks", stage_start)
+
+    return tables
+
+
+######################
+# Optional data cache
+######################
+# Running "python -m worlds.<apworld folder>.Data" saves the tables from load_tables, after Items.py and Locations.py
+# gave them their ids, to data_cache_file, with the lookups those two modules make from them. So they can be loaded
+# without parsing and generating everything again. The cache is only used while every file it can depend on
+# (the data files, the hooks and the modules of the apworld) is unchanged, otherwise everything is loaded like usual.
+
+data_cache_file = "data.cache"
+data_cache_version = 3
+
+def is_data_cache_source(path: str) -> bool:
+    """If the file at path (relative to the apworld, with / between folders) is one the cached tables can depend on"""
+    folders = path.split("/")[:-1]
+    if "__pycache__" in folders:
+        return False
+    if not folders:
+        return path.endswith(".py")
+    return folders[0] in ("data", "hooks")
+
+def get_data_cache_source_crc(path: str) -> int:
+    import zlib
+    return zlib.crc32(pkgutil.get_data(__name__, path) or b"")
+
+def list_data_cache_sources() -> dict[str, tuple[int, int|None, int|None]]:
+    """The size, CRC-32 and modification time of each source of the cache, by path. Only what's known without reading the files is filled in:
+    a folder has the size and modification time of its files, a .apworld has the size and CRC-32 of each file in its zip directory."""
+    apworld_folder = os.path.dirname(__file__)
+    sources = {}
+
+    if os.path.isdir(apworld_folder):
+        for folder, folder_names, file_names in os.walk(apworld_folder):
+            folder_names[:] = [folder_name for folder_name in folder_names if folder_name != "__pycache__"]
+            for file_name in file_names:
+                full_path = os.path.join(folder, file_name)
+                path = os.path.relpath(full_path, apworld_folder).replace(os.sep, "/")
+                if is_data_cache_source(path):
+                    stat = os.stat(full_path)
+                    sources[path] = (stat.st_size, None, stat.st_mtime_ns)
+        return sources
+
+    import zipfile
+    with zipfile.ZipFile(__loader__.archive) as apworld:
+        for zip_info in apworld.infolist():
+            if zip_info.is_dir() or not zip_info.filename.startswith(__loader__.prefix):
+                continue
+            path = zip_info.filename[len(__loader__.prefix):]
+            if is_data_cache_source(path):
+                sources[path] = (zip_info.file_size, zip_info.CRC, None)
+    return sources
+
+def is_data_cache_current(cached_sources: dict[str, tuple[int, int, int]]) -> bool:
+    sources = list_data_cache_sources()
+    if sources.keys() != cached_sources.keys():
+        return False
+
+    for path, (size, crc, modified_time) in sources.items():
+        cached_size, cached_crc, cached_modified_time = cached_sources[path]
+        if size != cached_size:
+            return False
+        # a file with another modification time (like after a copy) is only read to check if its content changed
+        if crc is None and modified_time != cached_modified_time:
+            crc = get_data_cache_source_crc(path)
+        if crc is not None and crc != cached_crc:
+            return False
+
+    return True
+
+def load_data_cache() -> dict|None:
+    try:
+        data_cache = pkgutil.get_data(__name__, data_cache_file)
+    except OSError:
+        return None
+
+    import pickle
+
+    class DataCacheUnpickler(pickle.Unpickler):
+        def find_class(self, module_name: str, name: str):
+            # the records are the ones of this module, whatever the apworld's folder was called when the cache was made
+            if module_name.endswith(".Data") and name in ("ManualItemData", "ManualLocationData"):
+                return globals()[name]
+            return super().find_class(module_name, name)
+
+    try:
+        data_cache = DataCacheUnpickler(io.BytesIO(data_cache)).load()
+    except Exception:
+        return None
+
+    if not isinstance(data_cache, dict) or data_cache.get("version") != data_cache_version:
+        return None
+
+    if not is_data_cache_current(data_cache["sources"]):
+        logging.info(f"{data_cache_file} is outdated, loading the data files instead.")
+        return None
+
+    return data_cache
+
+def build_data_cache() -> str:
+    """Saves the tables and the lookups of Items.py and Locations.py to data_cache_file, next to this file. Returns the path of the cache."""
+    import pickle
+    from .Items import load_item_lookups
+    from .Locations import load_location_lookups
+
+    tables = load_tables()
+    # pickled together with the tables they change, so the records in the lookups are the same objects as the ones in the tables
+    lookups = {
+        "items": load_item_lookups(tables["item_table"]),
+        "locations": load_location_lookups(tables["location_table"]),
+    }
+    sources = {path: (size, get_data_cache_source_crc(path), modified_time) for path, (size, _, modified_time) in list_data_cache_sources().items()}
+
+    path = os.path.join(os.path.dirname(__file__), data_cache_file)
+    with open(path, "wb") as f:
+        pickle.dump({
+            "version": data_cache_version,
+            "sources": sources,
+            "tables": tables,
+            "lookups": lookups,
+        }, f, protocol=pickle.HIGHEST_PROTOCOL)
+    return path
+
+
+stage_start = time.perf_counter()
+data_cache = load_data_cache()
+record_import_stage("Data.py: data cache", stage_start)
+
+if data_cache is None:
+    tables = load_tables()
+    cached_lookups = {} # Items.py and Locations.py make their lookups themselves
+else:
+    tables = data_cache["tables"]
+    cached_lookups = data_cache["lookups"]
+
+game_table = tables["game_table"] #dict
+item_table = tables["item_table"] #list
+location_table = tables["location_table"] #list
+region_table = tables["region_table"] #dict
+category_table = tables["category_table"] #dict
+meta_table = tables["meta_table"] #dict
+
+stage_start = time.perf_counter()
 
 # seed all of the tables for validation
 DataValidation.game_table = game_table
@@ -92,3 +415,9 @@ if len(validation_errors) > 0:
     logging.error("\nValidationError(s): \n\n%s\n\n" % ("\n".join([' - ' + str(validation_error) for validation_error in validation_errors])))
     print("\n\nYou can close this window.\n")
     keeping_terminal_open = input("If you are running from a terminal, press Ctrl-C followed by ENTER to break execution.")
+
+record_import_stage("Data.py: validation", stage_start)
+
+
+if __name__ == "__main__":
+    print(f"Saved the data cache to {build_data_cache()}")
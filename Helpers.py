@@ -1,12 +1,13 @@
-from BaseClasses import MultiWorld, Item
-from typing import Optional, List
+from BaseClasses import MultiWorld, Item, Region
+from typing import Iterable, Optional, List
 from worlds.AutoWorld import World
-from .Data import category_table
-from .Items import ManualItem
-from .Locations import ManualLocation
+from .Data import category_table, ManualDataRecord
+from .Items import ManualItem, item_table
+from .Locations import ManualLocation, location_table
 from .hooks.Helpers import before_is_category_enabled, before_is_item_enabled, before_is_location_enabled
 
 from typing import Union
+from collections import Counter
 
 def is_option_enabled(multiworld: MultiWorld, player: int, name: str) -> bool:
     return get_option_value(multiworld, player, name) > 0
@@ -36,6 +37,28 @@ def is_category_enabled(multiworld: MultiWorld, player: int, category_name: str)
     category_data = category_table.get(category_name, {})
     return resolve_yaml_option(multiworld, player, category_data)
 
+# Every category of the data gets a bit, so each player's disabled categories are one int (see get_disabled_categories)
+# and checking all the categories of an item or location is a single AND
+category_bits: dict[str, int] = {}
+for category in [*category_table, *(category for item in item_table for category in item.category), *(category for location in location_table for category in location.category)]:
+    if category not in category_bits:
+        category_bits[category] = 1 << len(category_bits)
+category_masks: dict[tuple, int] = {}
+
+def get_disabled_categories(multiworld: MultiWorld, player: int) -> int:
+    """Returns the bits of the categories disabled for the player. They are resolved once, the first time they're needed,
+    which is after generate_early so the options are final."""
+    world = multiworld.worlds[player]
+    disabled_categories = getattr(world, "disabled_categories", None)
+    if disabled_categories is None:
+        disabled_categories = 0
+        for category, bit in category_bits.items():
+            if not is_category_enabled(multiworld, player, category):
+                disabled_categories |= bit
+        world.disabled_categories = disabled_categories
+
+    return disabled_categories
+
 def resolve_yaml_option(multiworld: MultiWorld, player: int, data: dict) -> bool:
     if "yaml_option" in data:
         for option_name in data["yaml_option"]:
@@ -84,13 +107,21 @@ def _is_manualobject_enabled(multiworld: MultiWorld, player: int, object: any) -
     """Internal method: Check if a Manual Object has any category disabled by a yaml option.
     \nPlease use the proper is_'item/location'_enabled or is_'item/location'_name_enabled methods instead.
     """
-    enabled = True
-    for category in object.get("category", []):
-        if not is_category_enabled(multiworld, player, category):
-            enabled = False
-            break
-
-    return enabled
+    # the item and location records have it as an attribute, anything else (like a dict from a hook) is read like a dict
+    categories = object.category if isinstance(object, ManualDataRecord) else object.get("category", ())
+    mask = category_masks.get(categories) if type(categories) is tuple else None
+    if mask is None:
+        mask = 0
+        for category in categories:
+            if category not in category_bits:
+                # only a category that isn't in the data (like one a hook gave out) isn't in the bitmap, check those one by one
+                return all(is_category_enabled(multiworld, player, category) for category in categories)
+            mask |= category_bits[category]
+
+        if type(categories) is tuple:
+            category_masks[categories] = mask
+
+    return not mask & get_disabled_categories(multiworld, player)
 
 def get_items_for_player(multiworld: MultiWorld, player: int, includePrecollected: bool = False) -> List[Item]:
     """Return list of items of a player including placed items"""
@@ -99,6 +130,59 @@ def get_items_for_player(multiworld: MultiWorld, player: int, includePrecollecte
         items.extend(multiworld.precollected_items.get(player, []))
     return items
 
+def remove_items_from_pool(item_pool: List[Item], item_names: Iterable[str]) -> List[Item]:
+    """Remove one copy of an item from the item pool (in place) for each name in item_names, using a single pass over the pool.\n
+    Returns the removed items, in the same order as item_names.
+    """
+    item_names = list(item_names)
+    names_to_remove = Counter(item_names)
+    removed_items = {}
+    kept_items = []
+
+    for item in item_pool:
+        if names_to_remove.get(item.name, 0) > 0:
+            names_to_remove[item.name] -= 1
+            removed_items.setdefault(item.name, []).append(item)
+        else:
+            kept_items.append(item)
+
+    missing_items = +names_to_remove
+    if missing_items:
+        raise ValueError(f"Could not remove these items from the item pool, there aren't enough of them: {dict(missing_items)}")
+
+    item_pool[:] = kept_items
+    removed_items = {name: iter(items) for name, items in removed_items.items()}
+    return [next(removed_items[name]) for name in item_names]
+
+def get_player_regions(multiworld: MultiWorld, player: int) -> Iterable[Region]:
+    if hasattr(multiworld, "get_regions"):
+        return multiworld.get_regions(player)
+    return [region for region in multiworld.regions if region.player == player]
+
+def remove_locations_by_name(multiworld: MultiWorld, player: int, location_names: Iterable[str]) -> None:
+    """Remove every location named in location_names from the player's regions"""
+    location_names = set(location_names)
+    if not location_names:
+        return
+
+    for region in get_player_regions(multiworld, player):
+        if any(location.name in location_names for location in region.locations):
+            region.locations[:] = [location for location in region.locations if location.name not in location_names]
+
+    if hasattr(multiworld, "clear_location_cache"):
+        multiworld.clear_location_cache()
+
+def get_item_counts_by_player(multiworld: MultiWorld, includePrecollected: bool = False) -> dict[int, Counter]:
+    """Return the count of each item name of every player, including placed items, in a single pass over the multiworld"""
+    item_counts = {player: Counter() for player in multiworld.player_ids}
+    for item in multiworld.get_items():
+        item_counts.setdefault(item.player, Counter())[item.name] += 1
+    if includePrecollected:
+        for player, items in multiworld.precollected_items.items():
+            for item in items:
+                item_counts.setdefault(player, Counter())[item.name] += 1
+    return item_counts
+
 def get_items_with_value(world: World, multiworld: MultiWorld, value: str, player: Optional[int] = None, force: bool = False) -> dict[str, int]:
     """Return a dict of every items with a specific value type present in their respective 'value' dict\n
     Output in the format 'Item Name': 'value count'\n
@@ -121,7 +205,7 @@ def get_items_with_value(world: World, multiworld: MultiWorld, value: str, playe
         world.item_values[player] = {}
 
     if value not in world.item_values.get(player, {}).keys() or force:
-        item_with_values = {i.name: world.item_name_to_item[i.name]['value'].get(value, 0)
+        item_with_values = {i.name: world.item_name_to_item[i.name].value.get(value, 0)
                             for i in player_items if i.code is not None
                             and i.name in world.item_name_groups.get(f'has_{value}_value', [])}
         world.item_values[player][value] = item_with_values
@@ -1,60 +1,105 @@
+import time
+
 from BaseClasses import Item
-from .Data import item_table
+from .Data import item_table, cached_lookups, ManualItemData
 from .Game import filler_item_name, starting_index
+from .Profiling import record_import_stage
+
+
+def get_category_counter_name(category_name: str) -> str:
+    """Name of the virtual item that ManualWorld.collect/remove use to keep count of a category's items in a CollectionState"""
+    return f"__category_{category_name}__"
 
 
 ######################
 # Generate item lookups
 ######################
 
-item_id_to_name: dict[int, str] = {}
-item_name_to_item: dict[str, dict] = {}
-item_name_groups: dict[str, str] = {}
+def load_item_lookups(item_table: list) -> dict:
+    """Gives the items their ids, turns them into ManualItemData (in place, in item_table) and returns the lookups of this module made from them.
+    Data.py keeps these in its data cache, so they aren't made again when the cache is used."""
+    item_id_to_name: dict[int, str] = {}
+    item_name_to_item: dict[str, ManualItemData] = {}
+    item_name_groups: dict[str, str] = {}
+    item_category_to_names: dict[str, list[str]] = {} # like item_name_groups, but only for the item categories
+    item_name_to_category_counters: dict[str, tuple[str, ...]] = {}
+    lastItemId = -1
+
+    count = starting_index
+
+    # add the filler item to the list of items for lookup
+    if filler_item_name:
+        item_table.append({
+            "name": filler_item_name
+        })
+
+    # add sequential generated ids to the lists
+    for key, val in enumerate(item_table):
+        if "id" in item_table[key]:
+            item_id = item_table[key]["id"]
+            if item_id >= count:
+                count = item_id
+            else:
+                raise ValueError(f"{item_table[key]['name']} has an invalid ID. ID must be at least {count + 1}")
+
+        item_table[key]["id"] = count
+        item_table[key]["progression"] = val["progression"] if "progression" in val else False
+        item_table[key] = ManualItemData(item_table[key])
+        count += 1
+
+    for item in item_table:
+        item_name = item.name
+        item_id_to_name[item.id] = item_name
+        item_name_to_item[item_name] = item
+
+        if item.id is not None:
+            lastItemId = max(lastItemId, item.id)
+
+        for c in item.category:
+            if c not in item_name_groups:
+                item_name_groups[c] = []
+            item_name_groups[c].append(item_name)
+
+        for c in dict.fromkeys(item.category):
+            if c not in item_category_to_names:
+                item_category_to_names[c] = []
+            item_category_to_names[c].append(item_name)
+
+        item_name_to_category_counters[item_name] = tuple(get_category_counter_name(c) for c in dict.fromkeys(item.category))
+
+        for v in item.get("value", {}).keys():
+            group_name = f"has_{v.lower().strip()}_value"
+            if group_name not in item_name_groups:
+                item_name_groups[group_name] = []
+            item_name_groups[group_name].append(item_name)
+
+    item_id_to_name[None] = "__Victory__"
+
+    return {
+        "item_id_to_name": item_id_to_name,
+        "item_name_to_item": item_name_to_item,
+        "item_name_groups": item_name_groups,
+        "item_category_to_names": item_category_to_names,
+        "item_name_to_category_counters": item_name_to_category_counters,
+        "lastItemId": lastItemId,
+        "item_name_to_id": {name: id for id, name in item_id_to_name.items()},
+    }
+
+stage_start = time.perf_counter()
+
+# from the data cache, its item_table already went through load_item_lookups
+item_lookups = cached_lookups.get("items") or load_item_lookups(item_table)
+
+item_id_to_name: dict[int, str] = item_lookups["item_id_to_name"]
+item_name_to_item: dict[str, ManualItemData] = item_lookups["item_name_to_item"]
+item_name_groups: dict[str, str] = item_lookups["item_name_groups"]
+item_category_to_names: dict[str, list[str]] = item_lookups["item_category_to_names"]
+item_name_to_category_counters: dict[str, tuple[str, ...]] = item_lookups["item_name_to_category_counters"]
+item_name_to_id: dict[str, int] = item_lookups["item_name_to_id"]
 advancement_item_names: set[str] = set()
-lastItemId = -1
-
-count = starting_index
-
-# add the filler item to the list of items for lookup
-if filler_item_name:
-    item_table.append({
-        "name": filler_item_name
-    })
-
-# add sequential generated ids to the lists
-for key, val in enumerate(item_table):
-    if "id" in item_table[key]:
-        item_id = item_table[key]["id"]
-        if item_id >= count:
-            count = item_id
-        else:
-            raise ValueError(f"{item_table[key]['name']} has an invalid ID. ID must be at least {count + 1}")
-
-    item_table[key]["id"] = count
-    item_table[key]["progression"] = val["progression"] if "progression" in val else False
-    count += 1
-
-for item in item_table:
-    item_name = item["name"]
-    item_id_to_name[item["id"]] = item_name
-    item_name_to_item[item_name] = item
-
-    if item["id"] is not None:
-        lastItemId = max(lastItemId, item["id"])
-
-    for c in item.get("category", []):
-        if c not in item_name_groups:
-            item_name_groups[c] = []
-        item_name_groups[c].append(item_name)
-
-    for v in item.get("value", {}).keys():
-        group_name = f"has_{v.lower().strip()}_value"
-        if group_name not in item_name_groups:
-            item_name_groups[group_name] = []
-        item_name_groups[group_name].append(item_name)
-
-item_id_to_name[None] = "__Victory__"
-item_name_to_id = {name: id for id, name in item_id_to_name.items()}
+lastItemId = item_lookups["lastItemId"]
+
+record_import_stage("Items.py: ids and lookups", stage_start)
 
 
 ######################
@@ -1,61 +1,90 @@
+import time
+
 from BaseClasses import Location
-from .Data import location_table
+from .Data import location_table, cached_lookups, ManualLocationData
 from .Game import starting_index
+from .Profiling import record_import_stage
 
 
 ######################
 # Generate location lookups
 ######################
 
-count = starting_index
-victory_names: list[str] = []
-
-# add sequential generated ids to the lists
-for key, _ in enumerate(location_table):
-    if "victory" in location_table[key] and location_table[key]["victory"]:
-        victory_names.append(location_table[key]["name"])
-
-    if "id" in location_table[key]:
-        item_id = location_table[key]["id"]
-        if item_id >= count:
-            count = item_id
-        else:
-            raise ValueError(f"{location_table[key]['name']} has an invalid ID. ID must be at least {count + 1}")
-
-    location_table[key]["id"] = count
-
-    if not "region" in location_table[key]:
-        location_table[key]["region"] = "Manual" # all locations are in the same region for Manual
-
-    count += 1
-
-if not victory_names:
-    # Add the game completion location, which will have the Victory item assigned to it automatically
-    location_table.append({
-        "id": count + 1,
-        "name": "__Manual Game Complete__",
-        "region": "Manual",
-        "requires": []
-        # "category": custom_victory_location["category"] if "category" in custom_victory_location else []
-    })
-    victory_names.append("__Manual Game Complete__")
-
-location_id_to_name: dict[int, str] = {}
-location_name_to_location: dict[str, dict] = {}
-location_name_groups: dict[str, list[str]] = {}
-
-for item in location_table:
-    location_id_to_name[item["id"]] = item["name"]
-    location_name_to_location[item["name"]] = item
-
-    for c in item.get("category", []):
-        if c not in location_name_groups:
-            location_name_groups[c] = []
-        location_name_groups[c].append(item["name"])
-
-
-# location_id_to_name[None] = "__Manual Game Complete__"
-location_name_to_id = {name: id for id, name in location_id_to_name.items()}
+def load_location_lookups(location_table: list) -> dict:
+    """Gives the locations their ids, turns them into ManualLocationData (in place, in location_table) and returns the lookups of this module made from them.
+    Data.py keeps these in its data cache, so they aren't made again when the cache is used."""
+    count = starting_index
+    victory_names: list[str] = []
+
+    # add sequential generated ids to the lists
+    for key, _ in enumerate(location_table):
+        if "victory" in location_table[key] and location_table[key]["victory"]:
+            victory_names.append(location_table[key]["name"])
+
+        if "id" in location_table[key]:
+            item_id = location_table[key]["id"]
+            if item_id >= count:
+                count = item_id
+            else:
+                raise ValueError(f"{location_table[key]['name']} has an invalid ID. ID must be at least {count + 1}")
+
+        location_table[key]["id"] = count
+
+        if not "region" in location_table[key]:
+            location_table[key]["region"] = "Manual" # all locations are in the same region for Manual
+
+        location_table[key] = ManualLocationData(location_table[key])
+        count += 1
+
+    if not victory_names:
+        # Add the game completion location, which will have the Victory item assigned to it automatically
+        location_table.append(ManualLocationData({
+            "id": count + 1,
+            "name": "__Manual Game Complete__",
+            "region": "Manual",
+            "requires": []
+            # "category": custom_victory_location["category"] if "category" in custom_victory_location else []
+        }))
+        victory_names.append("__Manual Game Complete__")
+
+    location_id_to_name: dict[int, str] = {}
+    location_name_to_location: dict[str, ManualLocationData] = {}
+    location_name_groups: dict[str, list[str]] = {}
+
+    for item in location_table:
+        location_id_to_name[item.id] = item.name
+        location_name_to_location[item.name] = item
+
+        for c in item.category:
+            if c not in location_name_groups:
+                location_name_groups[c] = []
+            location_name_groups[c].append(item.name)
+
+    # location_id_to_name[None] = "__Manual Game Complete__"
+
+    return {
+        "victory_names": victory_names,
+        # the goal option stores the index of the chosen victory location in victory_names
+        "victory_name_to_index": {name: index for index, name in enumerate(victory_names)},
+        "location_id_to_name": location_id_to_name,
+        "location_name_to_location": location_name_to_location,
+        "location_name_groups": location_name_groups,
+        "location_name_to_id": {name: id for id, name in location_id_to_name.items()},
+    }
+
+stage_start = time.perf_counter()
+
+# from the data cache, its location_table already went through load_location_lookups
+location_lookups = cached_lookups.get("locations") or load_location_lookups(location_table)
+
+victory_names: list[str] = location_lookups["victory_names"]
+victory_name_to_index: dict[str, int] = location_lookups["victory_name_to_index"]
+location_id_to_name: dict[int, str] = location_lookups["location_id_to_name"]
+location_name_to_location: dict[str, ManualLocationData] = location_lookups["location_name_to_location"]
+location_name_groups: dict[str, list[str]] = location_lookups["location_name_groups"]
+location_name_to_id: dict[str, int] = location_lookups["location_name_to_id"]
+
+record_import_stage("Locations.py: ids and lookups", stage_start)
 
 ######################
 # Location classes
@@ -64,3 +93,5 @@ location_name_to_id = {name: id for id, name in location_id_to_name.items()}
 
 class ManualLocation(Location):
     game = "Manual"
+
+
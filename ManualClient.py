@@ -1,11 +1,12 @@
 from __future__ import annotations
 import time
+from collections import Counter
 from typing import Any
 import typing
 from worlds import AutoWorldRegister, network_data_package
 import json
 
-import asyncio, re
+import asyncio
 
 import ModuleUpdate
 ModuleUpdate.update()
@@ -31,7 +32,7 @@ class ManualClientCommandProcessor(ClientCommandProcessor):
     def _cmd_resync(self) -> bool:
         """Manually trigger a resync."""
         self.output("Syncing items.")
-        self.ctx.syncing = True
+        self.ctx.request_sync()
         return True
 
     @mark_raw
@@ -44,8 +45,7 @@ class ManualClientCommandProcessor(ClientCommandProcessor):
         )
         if usable:
             location_id = self.ctx.location_names_to_id[location_name]
-            self.ctx.locations_checked.append(location_id)
-            self.ctx.syncing = True
+            self.ctx.queue_location_check(location_id)
         else:
             self.output(response)
             return False
@@ -93,9 +93,25 @@ class ManualContext(SuperContext):
 
         self.send_index: int = 0
         self.syncing = False
+
+        # what game_watcher_manual sends the next time it wakes up, which is only when send_event is set
+        self.pending_location_checks: list[int] = []
+        self.send_event = asyncio.Event()
         self.game = game
         self.username = player_name
 
+        # how many of each item id were received, counted from the end of items_received as it grows, see count_received_items
+        self.received_item_counts: Counter = Counter()
+        self.counted_items_received = None # the items_received list that was counted, it's a new list when the server resends everything
+        self.counted_items_received_length = 0
+
+        # built from the game's items, locations and categories by build_category_maps, so the tracker doesn't look them up on every refresh
+        self.item_id_to_categories: dict[int, tuple[str, ...]] = {}
+        self.category_to_item_ids: dict[str, list[int]] = {}
+        self.category_to_location_ids: dict[str, list[int]] = {}
+        self.hidden_categories: set[str] = set()
+        self.victory_categories: set[str] = set()
+
     async def server_auth(self, password_requested: bool = False):
         if password_requested and not self.password:
             await super(ManualContext, self).server_auth(password_requested)
@@ -154,6 +170,72 @@ class ManualContext(SuperContext):
         name = self.item_names.lookup_in_game(id)
         return self.get_item_by_name(name)
 
+    def request_sync(self) -> None:
+        self.syncing = True
+        self.send_event.set()
+
+    def queue_location_check(self, location_id: int) -> None:
+        """Queues a location check, the checks queued together are sent in the same LocationChecks"""
+        self.pending_location_checks.append(location_id)
+        self.request_sync()
+
+    def get_item_categories(self, item_id: int) -> tuple[str, ...]:
+        if item_id not in self.item_id_to_categories:
+            item = self.get_item_by_id(item_id)
+            self.item_id_to_categories[item_id] = tuple(item.get("category") or ["(No Category)"])
+        return self.item_id_to_categories[item_id]
+
+    def build_category_maps(self) -> None:
+        """Sorts the item and location ids of the game into their categories, leaving out the hidden categories.
+        Items and locations without a category are put in "(No Category)"."""
+        world = AutoWorldRegister.world_types.get(self.game)
+        world_category_table = getattr(world, "category_table", {})
+        self.hidden_categories = {category for category in {*self.category_table, *world_category_table}
+                                  if (self.category_table.get(category) or world_category_table.get(category, {})).get("hidden")}
+
+        self.item_id_to_categories = {}
+        self.category_to_item_ids = {"(No Category)": []}
+        for item in self.item_table.values() or getattr(world, "item_name_to_item", {}).values():
+            item_id = self.item_names_to_id.get(item["name"])
+            if item_id is None:
+                continue
+
+            # the hidden categories are kept here, they still decide which category labels a received item updates
+            self.item_id_to_categories[item_id] = tuple(item.get("category") or ["(No Category)"])
+            for category in self.item_id_to_categories[item_id]:
+                if category not in self.hidden_categories:
+                    self.category_to_item_ids.setdefault(category, []).append(item_id)
+
+        self.category_to_location_ids = {"(No Category)": []}
+        for location in self.location_table.values() or getattr(world, "location_name_to_location", {}).values():
+            location_id = self.location_names_to_id.get(location["name"])
+            if location_id is None:
+                continue
+
+            # a location whose categories are all hidden isn't listed at all
+            for category in location.get("category") or ["(No Category)"]:
+                if category not in self.hidden_categories:
+                    self.category_to_location_ids.setdefault(category, []).append(location_id)
+
+        # the goal is listed in its categories even when they're hidden
+        self.victory_categories = set(self.goal_location.get("category") or ["(No Category)"])
+
+    def count_received_items(self) -> list[int] | None:
+        """Adds the items received since the last call to received_item_counts and returns their ids, in the order they were first received.
+        Returns None when items_received was replaced (on a reconnect or a resync) and counted again from the start."""
+        recounted = self.counted_items_received is not self.items_received
+        if recounted:
+            self.received_item_counts = Counter()
+            self.counted_items_received = self.items_received
+            self.counted_items_received_length = 0
+
+        # the victory button adds a plain "__Victory__" to items_received, it has no item id
+        new_item_ids = [network_item.item for network_item in self.items_received[self.counted_items_received_length:] if hasattr(network_item, "item")]
+        self.counted_items_received_length = len(self.items_received)
+        self.received_item_counts.update(new_item_ids)
+
+        return None if recounted else list(dict.fromkeys(new_item_ids))
+
     def update_ids(self, data_package) -> None:
         self.location_names_to_id = data_package['location_name_to_id']
         self.item_names_to_id = data_package['item_name_to_id']
@@ -180,15 +262,19 @@ class ManualContext(SuperContext):
         if cmd in {"Connected", "DataPackage"}:
             if cmd == "Connected":
                 Utils.persistent_store("client", "last_manual_game", self.game)
+                # the hints of the last slot aren't this one's, update_hints finds this slot's again
+                self.ui.hinted_location_ids = set()
                 goal = args["slot_data"].get("goal")
                 if goal and goal < len(self.victory_names):
                     self.goal_location = self.get_location_by_name(self.victory_names[goal])
                 if args['slot_data'].get('death_link'):
                     self.ui.enable_death_link()
                     self.set_deathlink = True
+                    self.send_event.set()
                     self.last_death_link = 0
                 logger.info(f"Slot data: {args['slot_data']}")
 
+            self.build_category_maps()
             self.ui.build_tracker_and_locations_table()
             self.ui.update_tracker_and_locations_table(update_highlights=True)
         elif cmd in {"ReceivedItems"}:
@@ -225,6 +311,10 @@ class ManualContext(SuperContext):
         from kivy.uix.textinput import TextInput
         from kivy.uix.tabbedpanel import TabbedPanelItem
         from kivy.uix.treeview import TreeView, TreeViewNode, TreeViewLabel
+        from kivy.uix.recycleview import RecycleView
+        from kivy.uix.recycleboxlayout import RecycleBoxLayout
+        from kivy.properties import BooleanProperty, NumericProperty
+        from kivy.app import App
         from kivy.clock import Clock
         from kivy.core.window import Window
 
@@ -237,12 +327,42 @@ class ManualContext(SuperContext):
         class LocationsLayoutScrollable(ScrollView):
             pass
 
-        class TreeViewButton(Button, TreeViewNode):
-            victory: bool = False
-            id: int = None
+        class TrackerItemLabel(Label):
+            item_id = NumericProperty(0)
 
-        class TreeViewScrollView(ScrollView, TreeViewNode):
-            pass
+        class LocationButton(Button):
+            location_id = NumericProperty(0)
+            victory = BooleanProperty(False)
+
+            def on_release(self):
+                manager = App.get_running_app()
+                if self.victory:
+                    manager.victory_button_callback(self)
+                else:
+                    manager.location_button_callback(self.location_id, self)
+
+        class TreeViewRecycleView(RecycleView, TreeViewNode):
+            """The list of a category's items or locations. Its data (one dict per row, with every property of the viewclass)
+            is the list itself, only the rows in view get a widget, and those widgets are reused while scrolling."""
+            def __init__(self, **kwargs):
+                # the viewclass lives on the layout manager, so it can only be set once the layout is added
+                viewclass = kwargs.pop("viewclass")
+                super().__init__(**kwargs)
+                layout = RecycleBoxLayout(orientation="vertical", default_size=(400, 30), default_size_hint=(None, None), size_hint_y=None)
+                layout.bind(minimum_height=layout.setter("height"))
+                self.add_widget(layout)
+                self.viewclass = viewclass
+
+            def set_size(self, row_count: int):
+                height = 30 * row_count
+
+                if height > 250:
+                    height = 250
+
+                if height < 10:
+                    height = 50
+
+                self.size = (Window.width / 2, height)
 
         class ManualManager(GameManager):
             logging_pairs = [
@@ -258,10 +378,20 @@ class ManualContext(SuperContext):
             active_item_accordion = 0
             active_location_accordion = 0
 
+            # the item labels are all updated after the tracker is built, then only the categories of new items and of highlighted ones
+            item_labels_outdated = True
+            highlighted_item_categories: set[str] = set()
+
             ctx: ManualContext
 
             def __init__(self, ctx):
                 super().__init__(ctx)
+                # the locations put in "(Hinted)" since the last connection, and the label and list of each category of the built tracker, by category name
+                self.hinted_location_ids: set[int] = set()
+                self.item_category_nodes: dict[str, tuple[TreeViewLabel, TreeViewRecycleView]] = {}
+                self.location_category_nodes: dict[str, tuple[TreeViewLabel, TreeViewRecycleView]] = {}
+                self.items_received_label = None
+                self.locations_remaining_label = None
 
             def build(self) -> Layout:
                 super().build()
@@ -294,6 +424,10 @@ class ManualContext(SuperContext):
                 self.item_categories = ["(No Category)"]
                 self.listed_locations = {"(No Category)": [], "(Hinted)": []}
                 self.location_categories = ["(No Category)", "(Hinted)"]
+                self.item_category_nodes = {}
+                self.location_category_nodes = {}
+                self.items_received_label = None
+                self.locations_remaining_label = None
 
             def set_active_item_accordion(self, instance):
                 index = 0
@@ -329,96 +463,77 @@ class ManualContext(SuperContext):
                     self.death_link_button.background_color = self.ctx.colors['deathlink_primed']
                 else:
                     self.ctx.deathlink_out = True
+                    self.ctx.send_event.set()
                     self.death_link_button.text = "Death Link: Sent"
                     self.death_link_button.background_color = self.ctx.colors['deathlink_sent']
 
             def update_hints(self):
                 super().update_hints()
-                rebuild = False
+                new_hinted_location_ids = []
                 for hint in self.ctx.stored_data.get(f"_read_hints_{self.ctx.team}_{self.ctx.slot}", []):
-                    if hint["finding_player"] == self.ctx.slot:
+                    if hint["finding_player"] == self.ctx.slot and hint["location"] not in self.hinted_location_ids:
                         if hint["location"] in self.ctx.missing_locations:
-                            location = self.ctx.get_location_by_id(hint["location"])
-                            location["category"] = location.get("category", [])
-                            if "(Hinted)" not in location["category"]:
-                                location["category"].append("(Hinted)")
-                                rebuild = True
-
-                if rebuild:
-                    self.build_tracker_and_locations_table()
+                            self.hinted_location_ids.add(hint["location"])
+                            new_hinted_location_ids.append(hint["location"])
+
+                # the next build lists all of the hints in "(Hinted)", a built tracker only gets the rows of the new ones added to it
+                if new_hinted_location_ids and "(Hinted)" in self.location_category_nodes:
+                    _, hinted_list = self.location_category_nodes["(Hinted)"]
+                    self.listed_locations["(Hinted)"].extend(new_hinted_location_ids)
+                    hinted_list.data = hinted_list.data + [{"text": self.ctx.location_names.lookup_in_game(location_id), "location_id": location_id, "victory": False,
+                                                            "background_color": self.ctx.colors['location_default']} for location_id in new_hinted_location_ids]
                 self.update_tracker_and_locations_table()
 
             def build_tracker_and_locations_table(self):
                 self.tracker_and_locations_panel.clear_widgets()
+                self.clear_lists()
 
                 if not self.ctx.server or not self.ctx.auth:
                     self.tracker_and_locations_panel.add_widget(
                                 Label(text="Waiting for connection...", size_hint_y=None, height=50, outline_width=1))
                     return
 
-                self.clear_lists()
+                self.item_labels_outdated = True
+                self.highlighted_item_categories = set()
 
                 # seed all category names to start
-                for item in self.ctx.item_table.values() or AutoWorldRegister.world_types[self.ctx.game].item_name_to_item.values():
-                    if "category" in item and len(item["category"]) > 0:
-                        for category in item["category"]:
-                            category_settings = self.ctx.category_table.get(category) or getattr(AutoWorldRegister.world_types[self.ctx.game], "category_table", {}).get(category, {})
-                            if "hidden" in category_settings and category_settings["hidden"]:
-                                continue
-                            if category not in self.item_categories:
-                                self.item_categories.append(category)
-
-                            if category not in self.listed_items:
-                                self.listed_items[category] = []
+                for category in self.ctx.category_to_item_ids:
+                    if category not in self.item_categories:
+                        self.item_categories.append(category)
 
+                    if category not in self.listed_items:
+                        self.listed_items[category] = []
 
                 # Items are not received on connect, so don't bother attempting to work with received items here
 
                 if not self.ctx.location_table and not hasattr(AutoWorldRegister.world_types[self.ctx.game], 'location_name_to_location'):
                     raise Exception("The apworld for %s is too outdated for this client. Please update it." % (self.ctx.game))
 
-                for location_id in self.ctx.missing_locations:
-                    # holy nesting, wow
-                    location_name = self.ctx.location_names.lookup_in_game(location_id)
-                    location = self.ctx.get_location_by_name(location_name)
-
-                    if not location:
+                for category, location_ids in self.ctx.category_to_location_ids.items():
+                    missing_location_ids = [location_id for location_id in location_ids if location_id in self.ctx.missing_locations]
+                    if not missing_location_ids:
                         continue
 
-                    if "category" in location and len(location["category"]) > 0:
-                        for category in location["category"]:
-                            category_settings = self.ctx.category_table.get(category) or getattr(AutoWorldRegister.world_types[self.ctx.game], "category_table", {}).get(category, {})
-                            if "hidden" in category_settings and category_settings["hidden"]:
-                                continue
-                            if category not in self.location_categories:
-                                self.location_categories.append(category)
-
-                            if category not in self.listed_locations:
-                                self.listed_locations[category] = []
-
-                            self.listed_locations[category].append(location_id)
-                    else: # leave it in the generic category
-                        self.listed_locations["(No Category)"].append(location_id)
+                    if category not in self.location_categories:
+                        self.location_categories.append(category)
 
-                victory_location =  self.ctx.goal_location
-                victory_categories = set()
+                    self.listed_locations.setdefault(category, []).extend(missing_location_ids)
 
-                if "category" in victory_location and len(victory_location["category"]) > 0:
-                    for category in victory_location["category"]:
-                        if category not in self.location_categories:
-                            self.location_categories.append(category)
+                self.listed_locations["(Hinted)"] = [location_id for location_id in self.hinted_location_ids if location_id in self.ctx.missing_locations]
 
-                        if category not in self.listed_locations:
-                            self.listed_locations[category] = []
-                            victory_categories.add(category)
+                victory_location = self.ctx.goal_location
+                for category in self.ctx.victory_categories:
+                    if category not in self.location_categories:
+                        self.location_categories.append(category)
 
-                if not victory_categories:
-                    victory_categories.add("(No Category)")
+                    if category not in self.listed_locations:
+                        self.listed_locations[category] = []
 
                 items_length = len(self.ctx.items_received)
                 tracker_panel_scrollable = TrackerLayoutScrollable(do_scroll=(False, True), bar_width=10)
                 tracker_panel = TreeView(root_options=dict(text="Items Received (%d)" % (items_length)), size_hint_y=None)
                 tracker_panel.bind(minimum_height=tracker_panel.setter('height'))
+                self.items_received_label = tracker_panel.root
 
                 # Since items_received is not available on connect, don't bother building item labels here
                 for item_category in sorted(self.listed_items.keys()):
@@ -426,15 +541,14 @@ class ManualContext(SuperContext):
                         TreeViewLabel(text = "%s (%s)" % (item_category, len(self.listed_items[item_category])))
                     )
 
-                    category_scroll = tracker_panel.add_node(TreeViewScrollView(size_hint=(1, None), size=(Window.width / 2, 250)), category_tree)
-                    category_layout = GridLayout(cols=1, size_hint_y=None)
-                    category_layout.bind(minimum_height = category_layout.setter('height'))
-                    category_scroll.add_widget(category_layout)
+                    category_list = tracker_panel.add_node(TreeViewRecycleView(viewclass=TrackerItemLabel, size_hint=(1, None), size=(Window.width / 2, 250)), category_tree)
+                    self.item_category_nodes[item_category] = (category_tree, category_list)
 
                 locations_length = len(self.ctx.missing_locations)
                 locations_panel_scrollable = LocationsLayoutScrollable(do_scroll=(False, True), bar_width=10)
                 locations_panel = TreeView(root_options=dict(text="Remaining Locations (%d)" % (locations_length + 1)), size_hint_y=None)
                 locations_panel.bind(minimum_height=locations_panel.setter('height'))
+                self.locations_remaining_label = locations_panel.root
 
                 # This seems like a redundant copy of the same check above?
                 if not self.ctx.location_table and not hasattr(AutoWorldRegister.world_types[self.ctx.game], 'location_name_to_location'):
@@ -443,35 +557,28 @@ class ManualContext(SuperContext):
                 for location_category in sorted(self.listed_locations.keys()):
                     locations_in_category = len(self.listed_locations[location_category])
 
-                    if ("category" in victory_location and location_category in victory_location["category"]) or \
-                        ("category" not in victory_location and location_category == "(No Category)"):
+                    if location_category in self.ctx.victory_categories:
                         locations_in_category += 1
 
                     category_tree = locations_panel.add_node(
                         TreeViewLabel(text = "%s (%s)" % (location_category, locations_in_category))
                     )
 
-                    category_scroll = locations_panel.add_node(TreeViewScrollView(size_hint=(1, None), size=(Window.width / 2, 250)), category_tree)
-                    category_layout = GridLayout(cols=1, size_hint_y=None)
-                    category_layout.bind(minimum_height = category_layout.setter('height'))
-                    category_scroll.add_widget(category_layout)
+                    category_list = locations_panel.add_node(TreeViewRecycleView(viewclass=LocationButton, size_hint=(1, None), size=(Window.width / 2, 250)), category_tree)
+                    self.location_category_nodes[location_category] = (category_tree, category_list)
+                    location_rows = []
 
                     for location_id in self.listed_locations[location_category]:
-                        location_button = TreeViewButton(text=self.ctx.location_names.lookup_in_game(location_id), size_hint=(None, None), height=30, width=400)
-                        location_button.bind(on_release=lambda *args, loc_id=location_id: self.location_button_callback(loc_id, *args))
-                        location_button.id = location_id
-                        category_layout.add_widget(location_button)
+                        location_rows.append({"text": self.ctx.location_names.lookup_in_game(location_id), "location_id": location_id, "victory": False,
+                                              "background_color": self.ctx.colors['location_default']})
 
                     # if this is the category that Victory is in, display the Victory button
-                    # if ("category" in victory_location_data and location_category in victory_location_data["category"]) or \
-                    #     ("category" not in victory_location_data and location_category == "(No Category)"):
-                    if location_category in victory_categories:
+                    if location_category in self.ctx.victory_categories:
                         # Add the Victory location to be marked at any point, which is why locations length has 1 added to it above
                         victory_text = "VICTORY! (seed finished)" if victory_location["name"] == "__Manual Game Complete__" else "GOAL: " + victory_location["name"]
-                        location_button = TreeViewButton(text=victory_text, size_hint=(None, None), height=30, width=400)
-                        location_button.victory = True
-                        location_button.bind(on_release=self.victory_button_callback)
-                        category_layout.add_widget(location_button)
+                        location_rows.append({"text": victory_text, "location_id": 0, "victory": True, "background_color": self.ctx.colors['location_default']})
+
+                    category_list.data = location_rows
 
                 tracker_panel_scrollable.add_widget(tracker_panel)
                 locations_panel_scrollable.add_widget(locations_panel)
@@ -482,183 +589,150 @@ class ManualContext(SuperContext):
                 items_length = len(self.ctx.items_received)
                 locations_length = len(self.ctx.missing_locations)
 
-                for _, child in enumerate(self.tracker_and_locations_panel.children):
-                    #
-                    # Structure of items:
-                    # TrackerLayoutScrollable -> TreeView -> TreeViewLabel, TreeViewScrollView -> GridLayout -> Label
-                    #        item tracker     -> category -> category label, category scroll   -> label col  -> item
-                    #
-                    if type(child) is TrackerLayoutScrollable:
-                        treeview = child.children[0] # TreeView
-                        treeview_nodes = treeview.iterate_all_nodes()
-
-                        items_received_label = next(treeview_nodes) # always the first node
-                        items_received_label.text = "Items Received (%s)" % (items_length)
-
-                        # loop for each category in listed items and get the label + scrollview
-                        for x in range(0, len(self.item_categories)):
-                            category_label = next(treeview_nodes) # TreeViewLabel for category
-                            category_scrollview = next(treeview_nodes) # TreeViewScrollView for housing category's grid layout
-
-                            old_category_text = category_label.text
-
-                            if type(category_label) is TreeViewLabel and type(category_scrollview) is TreeViewScrollView:
-                                category_grid = category_scrollview.children[0] # GridLayout
-
-                                category_name = re.sub(r"\s\(\d+\)$", "", category_label.text)
-                                category_count = 0
-                                category_unique_name_count = 0
-
-                                # Label (for existing item listings)
-                                for item in category_grid.children:
-                                     if type(item) is Label:
-                                        # Get the item name from the item Label, minus quantity, then do a lookup for count
-                                        old_item_text = item.text
-                                        item_name = re.sub(r"\s\(\d+\)$", "", item.text)
-                                        item_id = self.ctx.item_names_to_id[item_name]
-                                        item_count = len(list(i for i in self.ctx.items_received if i.item == item_id))
-
-                                        # Update the label quantity
-                                        item.text="%s (%s)" % (item_name, item_count)
-
-                                        if update_highlights:
-                                            item.bold = True if old_item_text != item.text else False
-
-                                        if item_count > 0:
-                                            category_count += item_count
-                                            category_unique_name_count += 1
-
-                                # Label (for new item listings)
-                                for network_item in self.ctx.items_received:
-                                    item_name = self.ctx.item_names.lookup_in_game(network_item.item)
-                                    item_data = self.ctx.get_item_by_name(item_name)
-
-                                    if "category" not in item_data or not item_data["category"]:
-                                        item_data["category"] = ["(No Category)"]
-
-                                    if category_name in item_data["category"] and network_item.item not in self.listed_items[category_name]:
-                                        item_count = len(list(i for i in self.ctx.items_received if i.item == network_item.item))
-                                        item_text = Label(text="%s (%s)" % (item_name, item_count),
-                                                    size_hint=(None, None), height=30, width=400, bold=True)
-
-                                        category_grid.add_widget(item_text)
-                                        self.listed_items[category_name].append(network_item.item)
-
-                                        category_count += item_count
-                                        category_unique_name_count += 1
-
-                            scrollview_height = 30 * category_unique_name_count
-
-                            if scrollview_height > 250:
-                                scrollview_height = 250
+                new_item_ids = self.ctx.count_received_items()
+                if new_item_ids is None or self.item_labels_outdated:
+                    # every category, with every received item
+                    self.item_labels_outdated = False
+                    new_item_ids = list(self.ctx.received_item_counts)
+                    item_categories_to_update = None
+                else:
+                    item_categories_to_update = {category for item_id in new_item_ids for category in self.ctx.get_item_categories(item_id)}
+                    if update_highlights:
+                        # so the highlights of the last update get taken off
+                        item_categories_to_update |= self.highlighted_item_categories
+
+                if update_highlights or item_categories_to_update is None:
+                    self.highlighted_item_categories = set()
+
+                #
+                # Structure of items:
+                # TrackerLayoutScrollable -> TreeView -> TreeViewLabel, TreeViewRecycleView -> rows of TrackerItemLabel
+                #        item tracker     -> category -> category label, category list      -> item
+                #
+                if self.items_received_label is not None:
+                    self.items_received_label.text = "Items Received (%s)" % (items_length)
+
+                for category_name, (category_label, category_list) in self.item_category_nodes.items():
+                    if item_categories_to_update is not None and category_name not in item_categories_to_update:
+                        continue
 
-                            if scrollview_height < 10:
-                                scrollview_height = 50
+                    old_category_text = category_label.text
+                    category_count = 0
+                    category_unique_name_count = 0
 
-                            category_name = re.sub(r"\s\(\d+\)$", "", category_label.text)
-                            category_label.text = "%s (%s)" % (category_name, category_count)
+                    # new item listings go after the existing ones
+                    for item_id in new_item_ids:
+                        if category_name in self.ctx.get_item_categories(item_id) and item_id not in self.listed_items[category_name]:
+                            self.listed_items[category_name].append(item_id)
 
-                            if update_highlights:
-                                category_label.bold = True if old_category_text != category_label.text else False
+                    old_item_rows = {item_row["item_id"]: item_row for item_row in category_list.data}
+                    item_rows = []
+                    for item_id in self.listed_items[category_name]:
+                        item_count = self.ctx.received_item_counts[item_id]
+                        item_text = "%s (%s)" % (self.ctx.item_names.lookup_in_game(item_id), item_count)
 
-                            category_scrollview.size=(Window.width / 2, scrollview_height)
+                        old_item_row = old_item_rows.get(item_id)
+                        if old_item_row is None: # new item listing
+                            bold = True
+                        elif update_highlights:
+                            bold = old_item_row["text"] != item_text
+                        else:
+                            bold = old_item_row["bold"]
 
-                    #
-                    # Structure of locations:
-                    # LocationsLayoutScrollable -> TreeView -> TreeViewLabel, TreeViewScrollView -> GridLayout -> Button
-                    #      location tracker     -> category -> category label, category scroll   -> label col  -> location
-                    #
-                    if type(child) is LocationsLayoutScrollable:
-                        treeview = child.children[0] # TreeView
-                        treeview_nodes = treeview.iterate_all_nodes()
+                        item_rows.append({"text": item_text, "bold": bold, "item_id": item_id})
 
-                        locations_remaining_label = next(treeview_nodes) # always the first node
-                        locations_remaining_label.text = "Remaining Locations (%d)" % (locations_length)
+                        if bold:
+                            self.highlighted_item_categories.add(category_name)
 
-                        # loop for each category in listed items and get the label + scrollview
-                        for x in range(0, len(self.location_categories)):
-                            category_label = next(treeview_nodes) # TreeViewLabel for category
-                            category_scrollview = next(treeview_nodes) # TreeViewScrollView for housing category's grid layout
+                        if item_count > 0:
+                            category_count += item_count
+                            category_unique_name_count += 1
 
-                            if type(category_label) is TreeViewLabel and type(category_scrollview) is TreeViewScrollView:
-                                category_grid = category_scrollview.children[0] # GridLayout
+                    category_list.data = item_rows
+                    category_list.set_size(category_unique_name_count)
 
-                                category_name = re.sub(r"\s\(\d+\/?(\d+)?\)$", "", category_label.text)
-                                category_count = 0
-                                reachable_count = 0
+                    category_label.text = "%s (%s)" % (category_name, category_count)
 
-                                buttons_to_remove = []
+                    if update_highlights:
+                        category_label.bold = True if old_category_text != category_label.text else False
 
-                                # Label (for existing item listings)
-                                for location_button in category_grid.children:
-                                    if type(location_button) is TreeViewButton:
-                                        # should only be true for the victory location button, which has different text
-                                        if location_button.text not in (self.ctx.location_table or AutoWorldRegister.world_types[self.ctx.game].location_name_to_location):
-                                            category_count += 1
-                                            if location_button.victory and "__Victory__" in self.ctx.tracker_reachable_events:
-                                                location_button.background_color = self.ctx.colors['location_in_logic']
-                                                reachable_count += 1
-                                            continue
+                    if category_label.bold:
+                        self.highlighted_item_categories.add(category_name)
 
-                                        if location_button.id and location_button.id not in self.ctx.missing_locations:
-                                            import logging
+                #
+                # Structure of locations:
+                # LocationsLayoutScrollable -> TreeView -> TreeViewLabel, TreeViewRecycleView -> rows of LocationButton
+                #      location tracker     -> category -> category label, category list      -> location
+                #
+                if self.locations_remaining_label is not None:
+                    self.locations_remaining_label.text = "Remaining Locations (%d)" % (locations_length)
 
-                                            logging.info("location button being removed: " + location_button.text)
-                                            buttons_to_remove.append(location_button)
-                                            continue
+                for category_name, (category_label, category_list) in self.location_category_nodes.items():
+                    category_count = 0
+                    reachable_count = 0
 
-                                        if location_button.text in self.ctx.tracker_reachable_locations:
-                                            location_button.background_color = self.ctx.colors['location_in_logic']
-                                            reachable_count += 1
-                                        else:
-                                            location_button.background_color = self.ctx.colors['location_default']
+                    location_rows = []
+                    for location_row in category_list.data:
+                        location_row = dict(location_row)
 
-                                        category_count += 1
+                        if location_row["victory"]:
+                            category_count += 1
+                            if "__Victory__" in self.ctx.tracker_reachable_events:
+                                location_row["background_color"] = self.ctx.colors['location_in_logic']
+                                reachable_count += 1
+                            location_rows.append(location_row)
+                            continue
 
-                                for location_button in buttons_to_remove:
-                                    location_button.parent.remove_widget(location_button)
+                        if location_row["location_id"] not in self.ctx.missing_locations:
+                            import logging
 
-                                scrollview_height = 30 * category_count
+                            logging.info("location button being removed: " + location_row["text"])
+                            continue
 
-                                if scrollview_height > 250:
-                                    scrollview_height = 250
+                        if location_row["text"] in self.ctx.tracker_reachable_locations:
+                            location_row["background_color"] = self.ctx.colors['location_in_logic']
+                            reachable_count += 1
+                        else:
+                            location_row["background_color"] = self.ctx.colors['location_default']
 
-                                if scrollview_height < 10:
-                                    scrollview_height = 50
+                        location_rows.append(location_row)
+                        category_count += 1
 
-                                count_text = category_count
+                    category_list.data = location_rows
+                    category_list.set_size(category_count)
 
-                                if tracker_loaded:
-                                    count_text = "{}/{}".format(reachable_count, category_count)
+                    count_text = category_count
 
-                                category_name = re.sub(r"\s\(\d+\/?(\d+)?\)$", "", category_label.text)
-                                category_label.text = "%s (%s)" % (category_name, count_text)
+                    if tracker_loaded:
+                        count_text = "{}/{}".format(reachable_count, category_count)
 
-                                if reachable_count > 0:
-                                    # treeviewlabels don't have background color. because #justkivythings.
-                                    category_label.even_color = self.ctx.colors['category_in_logic']
-                                    category_label.odd_color = self.ctx.colors['category_in_logic']
-                                else:
-                                    category_label.even_color = self.ctx.colors['category_even_default']
-                                    category_label.odd_color = self.ctx.colors['category_odd_default']
+                    category_label.text = "%s (%s)" % (category_name, count_text)
 
-                                category_scrollview.size=(Window.width / 2, scrollview_height)
+                    if reachable_count > 0:
+                        # treeviewlabels don't have background color. because #justkivythings.
+                        category_label.even_color = self.ctx.colors['category_in_logic']
+                        category_label.odd_color = self.ctx.colors['category_in_logic']
+                    else:
+                        category_label.even_color = self.ctx.colors['category_even_default']
+                        category_label.odd_color = self.ctx.colors['category_odd_default']
 
             def location_button_callback(self, location_id, button):
                 if button.text not in self.ctx.location_names_to_id:
                     raise Exception("Locations were not loaded correctly. Please reconnect your client.")
 
                 if location_id:
-                    self.ctx.locations_checked.append(location_id)
-                    self.ctx.syncing = True
-                    button.parent.remove_widget(button)
+                    self.ctx.queue_location_check(location_id)
+
+                    # the button is only the row's widget for now, it's the row that goes away
+                    category_list = button.parent.parent # LocationButton -> RecycleBoxLayout -> TreeViewRecycleView
+                    category_list.data = [location_row for location_row in category_list.data if location_row["location_id"] != location_id]
 
                     # message = [{"cmd": 'LocationChecks', "locations": [location_id]}]
                     # self.ctx.send_msgs(message)
 
             def victory_button_callback(self, button):
                 self.ctx.items_received.append("__Victory__")
-                self.ctx.syncing = True
+                self.ctx.request_sync()
 
         self.ui = ManualManager(self)
 
@@ -667,15 +741,31 @@ class ManualContext(SuperContext):
 
         self.ui_task = asyncio.create_task(self.ui.async_run(), name="UI")
 
+# After waking up, the watcher waits this long before sending, so a burst of clicks goes out as one message
+send_batch_delay = 0.1
+
 async def game_watcher_manual(ctx: ManualContext):
     while not ctx.exit_event.is_set():
+        # sleep until the UI or a command has something to send, main() also wakes it up when the client exits
+        await ctx.send_event.wait()
+        await asyncio.sleep(send_batch_delay)
+        ctx.send_event.clear()
+
+        if ctx.exit_event.is_set():
+            break
+
+        messages = []
         if ctx.syncing == True:
-            sync_msg = [{'cmd': 'Sync'}]
-            if ctx.locations_checked:
-                sync_msg.append({"cmd": "LocationChecks", "locations": list(ctx.locations_checked)})
-            await ctx.send_msgs(sync_msg)
+            messages.append({'cmd': 'Sync'})
             ctx.syncing = False
 
+        location_checks, ctx.pending_location_checks = ctx.pending_location_checks, []
+        if location_checks:
+            messages.append({"cmd": "LocationChecks", "locations": list(dict.fromkeys(location_checks))})
+
+        if messages:
+            await ctx.send_msgs(messages)
+
         if ctx.set_deathlink:
             ctx.set_deathlink = False
             await ctx.update_death_link(True)
@@ -684,15 +774,10 @@ async def game_watcher_manual(ctx: ManualContext):
             ctx.deathlink_out = False
             await ctx.send_death()
 
-        sending = []
         victory = ("__Victory__" in ctx.items_received)
-        ctx.locations_checked = sending
-        message = [{"cmd": 'LocationChecks', "locations": sending}]
-        await ctx.send_msgs(message)
         if not ctx.finished_game and victory:
             await ctx.send_msgs([{"cmd": "StatusUpdate", "status": ClientStatus.CLIENT_GOAL}])
             ctx.finished_game = True
-        await asyncio.sleep(0.1)
 
 
 def read_apmanual_file(apmanual_file):
@@ -725,6 +810,7 @@ async def main(args):
     await ctx.exit_event.wait()
     ctx.server_address = None
 
+    ctx.send_event.set()
     await progression_watcher
 
     await ctx.shutdown()
@@ -1,7 +1,10 @@
 
+import time
+
 from BaseClasses import Tutorial
 from worlds.AutoWorld import World, WebWorld
 from .Data import meta_table
+from .Profiling import record_import_stage
 
 ##############
 # Meta Classes
@@ -63,6 +66,8 @@ def set_world_webworld(web: WebWorld) -> WebWorld:
 #################
 # Meta Properties
 #################
+stage_start = time.perf_counter()
+
 world_description: str = set_world_description("""
     Manual games allow you to set custom check locations and custom item names that will be rolled into a multiworld.
     This allows any variety of game -- PC, console, board games, Microsoft Word memes... really anything -- to be part of a multiworld randomizer.
@@ -72,3 +77,5 @@ world_description: str = set_world_description("""
 world_webworld: ManualWeb = set_world_webworld(ManualWeb())
 
 enable_region_diagram = bool(meta_table.get("enable_region_diagram", False))
+
+record_import_stage("Meta.py: description and web world", stage_start)
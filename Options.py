@@ -1,24 +1,56 @@
 from Options import FreeText, NumericOption, Toggle, DefaultOnToggle, Choice, TextChoice, Range, PerGameCommonOptions, DeathLink, StartInventoryPool
 from dataclasses import make_dataclass
+import time
 from .hooks.Options import before_options_defined, after_options_defined
 from .Data import category_table, game_table
-from .Locations import victory_names
+from .Locations import victory_names, victory_name_to_index
 from .Items import item_table
 from .Game import starting_items
+from .Profiling import record_import_stage
 
 
 class FillerTrapPercent(Range):
     """How many fillers will be replaced with traps. 0 means no additional traps, 100 means all fillers are traps."""
     range_end = 100
 
+# With more victory locations than this, goal is a range of indexes into victory_names instead of a choice with one option per location,
+# so loading the options, making the yaml template and showing the options page don't go through hundreds of values
+goal_choice_limit = 50
+
+class VictoryIndex(Range):
+    """Choose your victory condition, by its number in the list of victory locations or by its location name."""
+    display_name = "Goal"
+    range_start = 0
+    range_end = max(len(victory_names) - 1, 0)
+    default = 0
+
+    # victory location names, lowercase like the option names of a Choice, so yamls written for the goal choice still work
+    victory_indexes = {name.lower(): index for name, index in victory_name_to_index.items()}
+
+    @classmethod
+    def from_text(cls, text: str) -> Range:
+        index = cls.victory_indexes.get(text.lower())
+        if index is not None:
+            return cls(index)
+        return super().from_text(text)
+
+    @classmethod
+    def get_option_name(cls, value: int) -> str:
+        return victory_names[value]
+
+stage_start = time.perf_counter()
 manual_options = before_options_defined({})
 
 manual_options["start_inventory_from_pool"] = StartInventoryPool
 
-if len(victory_names) > 1:
+goal_stage_start = time.perf_counter()
+if len(victory_names) > goal_choice_limit:
+    manual_options['goal'] = VictoryIndex
+elif len(victory_names) > 1:
     goal = {'option_' + v: i for i, v in enumerate(victory_names)}
     manual_options['goal'] = type('goal', (Choice,), goal)
     manual_options['goal'].__doc__ = "Choose your victory condition."
+record_import_stage("Options.py: goal option", goal_stage_start)
 
 if any(item.get('trap') for item in item_table):
     manual_options["filler_traps"] = FillerTrapPercent
@@ -55,3 +87,5 @@ for option_name, option_class in manual_options.items():
         dataclass_fields.append((option_name, option_class))
 
 manual_options_data = make_dataclass('ManualOptionsClass', dataclass_fields, bases=(PerGameCommonOptions,))
+
+record_import_stage("Options.py: all options, with the goal option", stage_start)
@@ -0,0 +1,164 @@
+import json
+import logging
+import os
+import time
+from collections import Counter, defaultdict
+from contextlib import contextmanager
+from functools import wraps
+from typing import Callable
+
+from BaseClasses import CollectionState
+from worlds.AutoWorld import World
+
+# Set this environment variable (to anything but 0) before generating to get a <output name>_Profile.json for each Manual slot,
+# in the output zip next to the spoiler. It is read once when the apworld is loaded, so without it nothing is wrapped or counted.
+profiling_environment_variable = "MANUAL_PROFILE_GENERATION"
+profiling_enabled = os.environ.get(profiling_environment_variable, "0") not in ("", "0")
+
+# Set this environment variable to see how long each stage of loading this apworld took: to the path of a .json file to write
+# the times there, or to anything else (but 0) to log them. "python -m worlds.<apworld folder>.Profiling" shows them too,
+# with the import time of each module of the apworld.
+import_profiling_environment_variable = "MANUAL_PROFILE_IMPORT"
+import_profiling = os.environ.get(import_profiling_environment_variable, "0")
+import_profiling_enabled = import_profiling not in ("", "0")
+import_stage_seconds: dict[str, float] = {}
+
+def record_import_stage(stage_name: str, start: float) -> None:
+    """Adds the time since start (a time.perf_counter()) to an import stage, if import profiling is enabled"""
+    if import_profiling_enabled:
+        import_stage_seconds[stage_name] = import_stage_seconds.get(stage_name, 0) + time.perf_counter() - start
+
+def report_import_profile(total_seconds: float) -> None:
+    if not import_profiling_enabled:
+        return
+
+    if import_profiling.endswith(".json"):
+        with open(import_profiling, "w") as f:
+            json.dump({"total": total_seconds, "stages": import_stage_seconds}, f, indent=4)
+        return
+
+    logging.info(f"{__package__} loaded in {total_seconds * 1000:.1f}ms:")
+    for stage_name, seconds in import_stage_seconds.items():
+        logging.info(f"  {stage_name}: {seconds * 1000:.1f}ms")
+
+class GenerationProfile:
+    """The wall time and calls of a slot's generation stages and hooks, and counters for what its rules did"""
+    def __init__(self):
+        self.seconds: dict[str, dict[str, float]] = defaultdict(lambda: defaultdict(float))
+        self.calls: dict[str, Counter] = defaultdict(Counter)
+        self.counters: Counter = Counter()
+        self.rule_evaluations: Counter = Counter()
+        self.fill_start: float|None = None
+
+    @contextmanager
+    def time(self, section: str, name: str):
+        start = time.perf_counter()
+        try:
+            yield
+        finally:
+            self.seconds[section][name] += time.perf_counter() - start
+            self.calls[section][name] += 1
+
+    def start_fill(self) -> None:
+        self.fill_start = time.perf_counter()
+
+    def end_fill(self) -> None:
+        """Records the time since start_fill as the "fill" stage"""
+        if self.fill_start is None:
+            return
+
+        self.seconds["stages"]["fill"] += time.perf_counter() - self.fill_start
+        self.calls["stages"]["fill"] += 1
+        self.fill_start = None
+
+    def count(self, counter_name: str, amount: int = 1) -> None:
+        self.counters[counter_name] += amount
+
+    def count_rule_evaluations(self, location_name: str, rule: Callable[[CollectionState], bool]) -> Callable[[CollectionState], bool]:
+        evaluations = self.rule_evaluations
+
+        def countedRule(state: CollectionState) -> bool:
+            evaluations[location_name] += 1
+            return rule(state)
+
+        return countedRule
+
+    def to_dict(self) -> dict:
+        profile = {}
+        for section in ("stages", "hooks"):
+            profile[section] = {name: {"seconds": seconds, "calls": self.calls[section][name]} for name, seconds in self.seconds[section].items()}
+
+        profile["counters"] = dict(self.counters)
+        profile["rule_evaluations"] = {
+            "total": sum(self.rule_evaluations.values()),
+            "per_location": dict(self.rule_evaluations.most_common()),
+        }
+        return profile
+
+    def write(self, path: str) -> None:
+        with open(path, "w") as f:
+            json.dump(self.to_dict(), f, indent=4)
+
+def profiled(method: Callable) -> Callable:
+    """Records the time and calls of a ManualWorld method in its generation profile"""
+    if not profiling_enabled:
+        return method
+
+    @wraps(method)
+    def profiledMethod(self: World, *args, **kwargs):
+        with self.generation_profile.time("stages", method.__name__):
+            return method(self, *args, **kwargs)
+
+    return profiledMethod
+
+def profiled_hook(hook: Callable) -> Callable:
+    """Records the time and calls of a hook in the generation profile of the world it is called with"""
+    if not profiling_enabled:
+        return hook
+
+    @wraps(hook)
+    def profiledHook(*args, **kwargs):
+        world = next((arg for arg in args if isinstance(arg, World)), None)
+        if getattr(world, "generation_profile", None) is None:
+            return hook(*args, **kwargs)
+
+        with world.generation_profile.time("hooks", hook.__name__):
+            return hook(*args, **kwargs)
+
+    return profiledHook
+
+def print_import_profile() -> None:
+    """Imports the apworld in a new interpreter and prints the import time of its modules and its import stages"""
+    import subprocess
+    import sys
+    import tempfile
+
+    with tempfile.TemporaryDirectory() as temp_dir:
+        profile_path = os.path.join(temp_dir, "import_profile.json")
+        process = subprocess.run([sys.executable, "-X", "importtime", "-c", f"import {__package__}"],
+                                 env=dict(os.environ, **{import_profiling_environment_variable: profile_path}), capture_output=True, text=True)
+        if not os.path.exists(profile_path):
+            print(process.stderr)
+            raise Exception(f"Could not import {__package__}")
+
+        with open(profile_path, "r") as f:
+            profile = json.load(f)
+
+    # each line looks like "import time: <self us> | <cumulative us> | <module>"
+    modules = []
+    for line in process.stderr.splitlines():
+        columns = line.split("|")
+        if len(columns) == 3 and columns[2].strip().startswith(__package__):
+            modules.append((columns[2].strip(), int(columns[0].split(":")[-1]) / 1000, int(columns[1]) / 1000))
+
+    print(f"{__package__} loaded in {profile['total'] * 1000:.1f}ms")
+    print("\nModules (self / cumulative):")
+    for module_name, self_ms, cumulative_ms in sorted(modules, key=lambda module: module[1], reverse=True):
+        print(f"  {module_name:<50}{self_ms:>8.1f}ms {cumulative_ms:>8.1f}ms")
+
+    print("\nStages:")
+    for stage_name, seconds in sorted(profile["stages"].items(), key=lambda stage: stage[1], reverse=True):
+        print(f"  {stage_name:<50}{seconds * 1000:>8.1f}ms")
+
+if __name__ == "__main__":
+    print_import_profile()
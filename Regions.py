@@ -1,5 +1,5 @@
 from BaseClasses import Entrance, MultiWorld, Region
-from .Helpers import is_category_enabled, is_location_enabled
+from .Helpers import is_category_enabled, is_location_enabled, get_option_value
 from .Data import region_table
 from .Locations import ManualLocation, location_name_to_location
 from worlds.AutoWorld import World
@@ -21,6 +21,19 @@ regionMap["Manual"] = {
 
 
 def create_regions(world: World, multiworld: MultiWorld, player: int):
+    # Only the chosen goal is created out of the victory locations
+    goal_name = world.victory_names[get_option_value(multiworld, player, 'goal')]
+
+    # Sort the enabled locations into their regions in one pass
+    region_locations = {region: [] for region in regionMap}
+    for location in world.location_table:
+        if location.region not in region_locations:
+            continue
+        if location.victory and location.name != goal_name:
+            continue
+        if is_location_enabled(multiworld, player, location):
+            region_locations[location.region].append(location.name)
+
     # Create regions and assign locations to each region
     for region in regionMap:
         if "connects_to" not in regionMap[region]:
@@ -32,13 +45,7 @@ def create_regions(world: World, multiworld: MultiWorld, player: int):
         if not exit_array:
             exit_array = None
 
-        locations = []
-        for location in world.location_table:
-            if "region" in location and location["region"] == region:
-                if is_location_enabled(multiworld, player, location):
-                    locations.append(location["name"])
-
-        new_region = create_region(world, multiworld, player, region, locations, exit_array)
+        new_region = create_region(world, multiworld, player, region, region_locations[region], exit_array)
         multiworld.regions += [new_region]
 
     menu = create_region(world, multiworld, player, "Menu", None, ["Manual"])
@@ -60,7 +67,7 @@ def create_region(world: World, multiworld: MultiWorld, player: int, name: str,
         for location in locations:
             loc_id = world.location_name_to_id.get(location, 0)
             locationObj = ManualLocation(player, location, loc_id, ret)
-            if location_name_to_location[location].get('prehint'):
+            if location_name_to_location[location].prehint:
                 world.options.start_location_hints.value.add(location)
             ret.locations.append(locationObj)
     if exits:
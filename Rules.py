@@ -1,9 +1,10 @@
-from typing import TYPE_CHECKING, Optional
+from typing import TYPE_CHECKING, Callable, Optional
 from worlds.generic.Rules import set_rule
 from .Regions import regionMap
 from .hooks import Rules
 from BaseClasses import MultiWorld, CollectionState
 from .Helpers import clamp, is_item_enabled, get_items_with_value, is_option_enabled
+from .Items import get_category_counter_name
 from worlds.AutoWorld import World
 
 import re
@@ -14,332 +15,367 @@ import logging
 if TYPE_CHECKING:
     from . import ManualWorld
 
-def infix_to_postfix(expr, location):
-    prec = {"&": 2, "|": 2, "!": 3}
-
-    stack = []
-    postfix = ""
-
-    try:
-        for c in expr:
-            if c.isnumeric():
-                postfix += c
-            elif c in prec:
-                while stack and stack[-1] != "(" and prec[c] <= prec[stack[-1]]:
-                    postfix += stack.pop()
-                stack.append(c)
-            elif c == "(":
-                stack.append(c)
-            elif c == ")":
-                while stack and stack[-1] != "(":
-                    postfix += stack.pop()
-                stack.pop()
-        while stack:
-            postfix += stack.pop()
-    except Exception:
-        raise KeyError("Invalid logic format for location/region {}.".format(location))
-    return postfix
-
-
-def evaluate_postfix(expr: str, location: str) -> bool:
-    stack = []
-    try:
-        for c in expr:
-            if c == "0":
-                stack.append(False)
-            elif c == "1":
-                stack.append(True)
-            elif c == "&":
-                op2 = stack.pop()
-                op1 = stack.pop()
-                stack.append(op1 and op2)
-            elif c == "|":
-                op2 = stack.pop()
-                op1 = stack.pop()
-                stack.append(op1 or op2)
-            elif c == "!":
-                op = stack.pop()
-                stack.append(not op)
-    except Exception:
-        raise KeyError("Invalid logic format for location/region {}.".format(location))
-
-    if len(stack) != 1:
-        raise KeyError("Invalid logic format for location/region {}.".format(location))
-    return stack.pop()
+# Tokens of a requires string, in the order they're matched: {functions(args)}, |items| or |@categories|, AND / OR / parenthesis / not, and 0 / 1 constants.
+# Anything else (whitespace, stray characters) is skipped, like the old postfix evaluator did.
+requires_token_regex = re.compile(r'(?P<function>\{(?P<func_name>\w+)\((?P<func_args>.*?)\)\})|(?P<item>\|[^|]+\|)|(?P<operator>\bAND\b|\bOR\b|[()!])|(?P<constant>[01])', re.IGNORECASE)
+
+def alwaysAccessible(state: CollectionState) -> bool:
+    return True
+
+def neverAccessible(state: CollectionState) -> bool:
+    return False
+
+def andRule(left: Callable[[CollectionState], bool], right: Callable[[CollectionState], bool]) -> Callable[[CollectionState], bool]:
+    return lambda state: left(state) and right(state)
+
+def orRule(left: Callable[[CollectionState], bool], right: Callable[[CollectionState], bool]) -> Callable[[CollectionState], bool]:
+    return lambda state: left(state) or right(state)
+
+def notRule(rule: Callable[[CollectionState], bool]) -> Callable[[CollectionState], bool]:
+    return lambda state: not rule(state)
+
+def invalidLogicFormat(area) -> KeyError:
+    return KeyError("Invalid logic format for location/region {}.".format(area))
+
+def resolve_require_count(item_count: str, available_count: int) -> int:
+    """Converts the count part of a |item:count| requirement ('all', 'half', 'N%') to a number based on how many of the item(s) exist"""
+    if item_count.lower() == 'all':
+        return available_count
+    elif item_count.lower() == 'half':
+        return int(available_count / 2)
+    else:
+        percent = clamp(float(item_count[:-1]) / 100, 0, 1)
+        return math.ceil(available_count * percent)
 
 def set_rules(world: "ManualWorld", multiworld: MultiWorld, player: int):
-    # this is only called when the area (think, location or region) has a "requires" field that is a string
-    def checkRequireStringForArea(state: CollectionState, area: dict):
-        requires_list = area["requires"]
+    # Requires are compiled once into rule functions here, so checking access during fill doesn't need to parse anything.
+    # The same requires string is often used by many areas (and functions can return requires strings), so they are shared.
+    compiled_requires: dict[str, Callable[[CollectionState], bool]] = {}
 
-        # Get the "real" item counts of item in the pool/placed/starting_items
-        items_counts = world.get_item_counts(player)
+    # this is only called when a requires string has an |item| or |@category| in it
+    def compileItemRequirement(item_base: str, area: dict) -> Callable[[CollectionState], bool]:
+        require_type = 'item'
 
-        if requires_list == "":
-            return True
+        if '|@' in item_base:
+            require_type = 'category'
 
-        for item in re.findall(r'\{(\w+)\((.*?)\)\}', requires_list):
-            func_name = item[0]
-            func_args = item[1].split(",")
-            if func_args == ['']:
-                func_args.pop()
+        item = item_base.lstrip('|@$').rstrip('|')
 
-            func = globals().get(func_name)
+        item_parts = item.split(":")  # type: list[str]
+        item_name = item
+        item_count = "1"
 
-            if func is None:
-                func = getattr(Rules, func_name, None)
+        if len(item_parts) > 1:
+            item_name = item_parts[0].strip()
+            item_count = item_parts[1].strip()
+
+        if require_type == 'category':
+            category_item_names = world.item_category_to_names.get(item_name, [])
+
+            # a category without any items has never been considered accessible, even for a count of 0
+            if not category_item_names:
+                return neverAccessible
+
+            def availableCount() -> int:
+                # Get the "real" item counts of item in the pool/placed/starting_items
+                items_counts = world.get_item_counts(player)
+                return sum([items_counts.get(category_item_name, 0) for category_item_name in category_item_names])
+
+            # ManualWorld.collect/remove keep this total up to date in the state
+            category_counter = get_category_counter_name(item_name)
+
+            def currentCount(state: CollectionState) -> int:
+                return state.count(category_counter, player)
+        else:
+            def availableCount() -> int:
+                return world.get_item_counts(player).get(item_name, 0)
+
+            def currentCount(state: CollectionState) -> int:
+                return state.count(item_name, player)
+
+        # 'all', 'half' and percentages depend on the item pool, so they're resolved the first time the rule is checked
+        required_count = None
+        if item_count.lower() not in ['all', 'half'] and not (item_count.endswith('%') and len(item_count) > 1):
+            try:
+                required_count = int(item_count)
+            except ValueError as e:
+                raise ValueError(f"Invalid item count `{item_name}` in {area}.") from e
 
-            if not callable(func):
-                raise ValueError(f"Invalid function `{func_name}` in {area}.")
+        def itemRequirement(state: CollectionState) -> bool:
+            nonlocal required_count
+            if required_count is None:
+                required_count = resolve_require_count(item_count, availableCount())
 
-            convert_req_function_args(func, func_args, area.get("name", f"An area with these parameters: {area}"))
+            return currentCount(state) >= required_count
+
+        return itemRequirement
+
+    # this is only called when a requires string has a {function(args)} in it
+    def compileFunctionRequirement(func_name: str, func_arguments: str, area: dict) -> Callable[[CollectionState], bool]:
+        func_args = func_arguments.split(",")
+        if func_args == ['']:
+            func_args.pop()
+
+        func = globals().get(func_name)
+
+        if func is None:
+            func = getattr(Rules, func_name, None)
+
+        if not callable(func):
+            raise ValueError(f"Invalid function `{func_name}` in {area}.")
+
+        convert_req_function_args(func, func_args, area.get("name", f"An area with these parameters: {area}"))
+
+        def functionRequirement(state: CollectionState) -> bool:
             result = func(world, multiworld, state, player, *func_args)
             if isinstance(result, bool):
-                requires_list = requires_list.replace("{" + func_name + "(" + item[1] + ")}", "1" if result else "0")
-            else:
-                requires_list = requires_list.replace("{" + func_name + "(" + item[1] + ")}", str(result))
+                return result
 
+            # functions can return a requires string of their own, which is compiled (once) and checked as a whole
+            return compileRequireStringForArea(str(result), area)(state)
 
-        # parse user written statement into list of each item
-        for item in re.findall(r'\|[^|]+\|', requires_list):
-            require_type = 'item'
+        return functionRequirement
 
-            if '|@' in item:
-                require_type = 'category'
+    # this is only called when the area (think, location or region) has a "requires" field that is a string
+    def compileRequireStringForArea(requires: str, area: dict) -> Callable[[CollectionState], bool]:
+        if requires in compiled_requires:
+            if world.generation_profile is not None:
+                world.generation_profile.count("requires_cache_hits")
+            return compiled_requires[requires]
+
+        if world.generation_profile is not None:
+            world.generation_profile.count("requires_cache_misses")
+
+        # operands are compiled rule functions, operators are kept as '&', '|', '!', '(' and ')'
+        tokens = []
+        for match in requires_token_regex.finditer(requires):
+            if match.group('function'):
+                tokens.append(compileFunctionRequirement(match.group('func_name'), match.group('func_args'), area))
+            elif match.group('item'):
+                tokens.append(compileItemRequirement(match.group('item'), area))
+            elif match.group('operator'):
+                operator = match.group('operator').lower()
+                tokens.append({'and': '&', 'or': '|'}.get(operator, operator))
+            else:
+                tokens.append(alwaysAccessible if match.group('constant') == '1' else neverAccessible)
 
-            item_base = item
-            item = item.lstrip('|@$').rstrip('|')
+        # AND and OR have the same precedence and are applied left to right, ! applies to the operand right after it
+        def parseExpression(position: int) -> tuple[Callable[[CollectionState], bool], int]:
+            rule, position = parseOperand(position)
 
-            item_parts = item.split(":")  # type: list[str]
-            item_name = item
-            item_count = "1"
+            while position < len(tokens) and tokens[position] in ['&', '|']:
+                operator = tokens[position]
+                right, position = parseOperand(position + 1)
+                rule = andRule(rule, right) if operator == '&' else orRule(rule, right)
 
+            return rule, position
 
-            if len(item_parts) > 1:
-                item_name = item_parts[0].strip()
-                item_count = item_parts[1].strip()
-
-            total = 0
-
-            if require_type == 'category':
-                category_items = [item for item in world.item_name_to_item.values() if "category" in item and item_name in item["category"]]
-                category_items_counts = sum([items_counts.get(category_item["name"], 0) for category_item in category_items])
-                if item_count.lower() == 'all':
-                    item_count = category_items_counts
-                elif item_count.lower() == 'half':
-                    item_count = int(category_items_counts / 2)
-                elif item_count.endswith('%') and len(item_count) > 1:
-                    percent = clamp(float(item_count[:-1]) / 100, 0, 1)
-                    item_count = math.ceil(category_items_counts * percent)
-                else:
-                    try:
-                        item_count = int(item_count)
-                    except ValueError as e:
-                        raise ValueError(f"Invalid item count `{item_name}` in {area}.") from e
-
-                for category_item in category_items:
-                    total += state.count(category_item["name"], player)
-
-                    if total >= item_count:
-                        requires_list = requires_list.replace(item_base, "1")
-            elif require_type == 'item':
-                item_current_count = items_counts.get(item_name, 0)
-                if item_count.lower() == 'all':
-                    item_count = item_current_count
-                elif item_count.lower() == 'half':
-                    item_count = int(item_current_count / 2)
-                elif item_count.endswith('%') and len(item_count) > 1:
-                    percent = clamp(float(item_count[:-1]) / 100, 0, 1)
-                    item_count = math.ceil(item_current_count * percent)
-                else:
-                    item_count = int(item_count)
+        def parseOperand(position: int) -> tuple[Callable[[CollectionState], bool], int]:
+            if position >= len(tokens):
+                raise invalidLogicFormat(area)
+
+            token = tokens[position]
+
+            if token == '!':
+                rule, position = parseOperand(position + 1)
+                return notRule(rule), position
 
-                total = state.count(item_name, player)
+            if token == '(':
+                rule, position = parseExpression(position + 1)
+                if position >= len(tokens) or tokens[position] != ')':
+                    raise invalidLogicFormat(area)
+                return rule, position + 1
 
-                if total >= item_count:
-                    requires_list = requires_list.replace(item_base, "1")
+            if callable(token):
+                return token, position + 1
 
-            if total <= item_count:
-                requires_list = requires_list.replace(item_base, "0")
+            raise invalidLogicFormat(area)
 
-        requires_list = re.sub(r'\s?\bAND\b\s?', '&', requires_list, 0, re.IGNORECASE)
-        requires_list = re.sub(r'\s?\bOR\b\s?', '|', requires_list, 0, re.IGNORECASE)
+        if not tokens:
+            rule = alwaysAccessible
+        else:
+            rule, position = parseExpression(0)
+            if position != len(tokens):
+                raise invalidLogicFormat(area)
 
-        requires_string = infix_to_postfix("".join(requires_list), area)
-        return (evaluate_postfix(requires_string, area))
+        compiled_requires[requires] = rule
+        return rule
 
     # this is only called when the area (think, location or region) has a "requires" field that is a dict
-    def checkRequireDictForArea(state: CollectionState, area: dict):
-        canAccess = True
+    def compileRequireDictForArea(area: dict) -> Callable[[CollectionState], bool]:
+        def splitItemCount(item: str) -> tuple[str, int]:
+            item_parts = item.split(":")
+            item_name = item
+            item_count = 1
+
+            if len(item_parts) > 1:
+                item_name = item_parts[0]
+                item_count = int(item_parts[1])
+
+            return item_name, item_count
+
+        requirements = [] # list of (is_or, [(item_name, item_count)])
 
         for item in area["requires"]:
             # if the require entry is an object with "or" or a list of items, treat it as a standalone require of its own
             if (isinstance(item, dict) and "or" in item and isinstance(item["or"], list)) or (isinstance(item, list)):
-                canAccessOr = True
                 or_items = item
 
                 if isinstance(item, dict):
                     or_items = item["or"]
 
-                for or_item in or_items:
-                    or_item_parts = or_item.split(":")
-                    or_item_name = or_item
-                    or_item_count = 1
-
-                    if len(or_item_parts) > 1:
-                        or_item_name = or_item_parts[0]
-                        or_item_count = int(or_item_parts[1])
+                requirements.append((True, [splitItemCount(or_item) for or_item in or_items]))
+            else:
+                requirements.append((False, [splitItemCount(item)]))
 
-                    if not state.has(or_item_name, player, or_item_count):
-                        canAccessOr = False
+        if not requirements:
+            return alwaysAccessible
 
-                if canAccessOr:
-                    canAccess = True
-                    break
-            else:
-                item_parts = item.split(":")
-                item_name = item
-                item_count = 1
+        def requireDict(state: CollectionState) -> bool:
+            canAccess = True
 
-                if len(item_parts) > 1:
-                    item_name = item_parts[0]
-                    item_count = int(item_parts[1])
+            for is_or, items in requirements:
+                if is_or:
+                    # a fully owned "or" entry grants access on its own
+                    if all(state.has(item_name, player, item_count) for item_name, item_count in items):
+                        return True
+                else:
+                    item_name, item_count = items[0]
+                    if not state.has(item_name, player, item_count):
+                        canAccess = False
 
-                if not state.has(item_name, player, item_count):
-                    canAccess = False
+            return canAccess
 
-        return canAccess
+        return requireDict
 
-    # handle any type of checking needed, then ferry the check off to a dedicated method for that check
-    def fullLocationOrRegionCheck(state: CollectionState, area: dict):
+    # handle any type of compiling needed, then ferry the area off to a dedicated method for that type of requires
+    def compileLocationOrRegionRule(area: dict) -> Callable[[CollectionState], bool]:
         # if it's not a usable object of some sort, default to true
         if not area:
-            return True
+            return alwaysAccessible
 
         # don't require the "requires" key for locations and regions if they don't need to use it
         if "requires" not in area.keys():
-            return True
+            return alwaysAccessible
 
         if isinstance(area["requires"], str):
-            return checkRequireStringForArea(state, area)
+            if area["requires"] == "":
+                return alwaysAccessible
+            return compileRequireStringForArea(area["requires"], area)
         else:  # item access is in dict form
-            return checkRequireDictForArea(state, area)
+            return compileRequireDictForArea(area)
+
+    region_rules: dict[str, Callable[[CollectionState], bool]] = {}
 
-    used_location_names = []
+    def getRegionRule(region: str) -> Callable[[CollectionState], bool]:
+        if region not in region_rules:
+            region_rules[region] = compileLocationOrRegionRule(regionMap[region])
+        return region_rules[region]
+
+    # the slot's locations by name, made here since before_set_rules can add or remove locations
+    name_to_location = {location.name: location for location in multiworld.get_locations(player)}
     # Region access rules
     for region in regionMap.keys():
-        used_location_names.extend([l.name for l in multiworld.get_region(region, player).locations])
         if region != "Menu":
             for exitRegion in multiworld.get_region(region, player).exits:
-                def fullRegionCheck(state: CollectionState, region=regionMap[region]):
-                    return fullLocationOrRegionCheck(state, region)
-
-                set_rule(multiworld.get_entrance(exitRegion.name, player), fullRegionCheck)
+                set_rule(multiworld.get_entrance(exitRegion.name, player), getRegionRule(region))
 
     # Location access rules
     for location in world.location_table:
-        if location["name"] not in used_location_names:
+        locFromWorld = name_to_location.get(location.name)
+        if locFromWorld is None:
             continue
 
-        locFromWorld = multiworld.get_location(location["name"], player)
-
-        locationRegion = regionMap[location["region"]] if "region" in location else None
-
-        if "requires" in location: # Location has requires, check them alongside the region requires
-            def checkBothLocationAndRegion(state: CollectionState, location=location, region=locationRegion):
-                locationCheck = fullLocationOrRegionCheck(state, location)
-                regionCheck = True # default to true unless there's a region with requires
-
-                if region:
-                    regionCheck = fullLocationOrRegionCheck(state, region)
-
-                return locationCheck and regionCheck
+        regionRule = getRegionRule(location.region) if location.region is not None else alwaysAccessible
 
-            set_rule(locFromWorld, checkBothLocationAndRegion)
-        elif "region" in location: # Only region access required, check the location's region's requires
-            def fullRegionCheck(state, region=locationRegion):
-                return fullLocationOrRegionCheck(state, region)
+        if location.requires is not None: # Location has requires, check them alongside the region requires
+            locationRule = compileLocationOrRegionRule(location)
 
-            set_rule(locFromWorld, fullRegionCheck)
+            if regionRule is not alwaysAccessible:
+                locationRule = andRule(locationRule, regionRule)
+        elif location.region is not None: # Only region access required, check the location's region's requires
+            locationRule = regionRule
         else: # No location region and no location requires? It's accessible.
-            def allRegionsAccessible(state):
-                return True
+            locationRule = alwaysAccessible
 
-            set_rule(locFromWorld, allRegionsAccessible)
+        if world.generation_profile is not None:
+            locationRule = world.generation_profile.count_rule_evaluations(location.name, locationRule)
+
+        set_rule(locFromWorld, locationRule)
 
     # Victory requirement
     multiworld.completion_condition[player] = lambda state: state.has("__Victory__", player)
 
-    def convert_req_function_args(func, args: list[str], areaName: str, warn: bool = False):
-        parameters = inspect.signature(func).parameters
-        knownArguments = ["world", "multiworld", "state", "player"]
-        index = 0
-        for parameter, info in parameters.items():
-            if parameter in knownArguments:
-                continue
+def convert_req_function_args(func, args: list[str], areaName: str, warn: bool = False):
+    parameters = inspect.signature(func).parameters
+    knownArguments = ["world", "multiworld", "state", "player"]
+    index = 0
+    for parameter, info in parameters.items():
+        if parameter in knownArguments:
+            continue
 
-            argType = info.annotation
-            optional = False
-            try:
-                if issubclass(argType, inspect._empty): #if not set then it wont get converted but still be checked for valid data at index
-                    argType = str
+        argType = info.annotation
+        optional = False
+        try:
+            if issubclass(argType, inspect._empty): #if not set then it wont get converted but still be checked for valid data at index
+                argType = str
 
-            except TypeError: # Optional
-                if argType.__module__ == 'typing' and argType._name == 'Optional':
-                    optional = True
-                    argType = argType.__args__[0]
-                else:
-                    #Implementing complex typing is not simple so ill skip it for now
-                    index += 1
-                    continue
+        except TypeError: # Optional
+            if argType.__module__ == 'typing' and argType._name == 'Optional':
+                optional = True
+                argType = argType.__args__[0]
+            else:
+                #Implementing complex typing is not simple so ill skip it for now
+                index += 1
+                continue
 
-            try:
-                value = args[index].strip()
+        try:
+            value = args[index].strip()
 
-            except IndexError:
-                if info is not inspect.Parameter.empty:
-                    value = info.default
+        except IndexError:
+            if info is not inspect.Parameter.empty:
+                value = info.default
 
-                else:
-                    raise Exception(f"A call of the {func.__name__} function in '{areaName}'s requirement, asks for a value of type {argType}\nfor its argument '{info.name}' but its missing")
+            else:
+                raise Exception(f"A call of the {func.__name__} function in '{areaName}'s requirement, asks for a value of type {argType}\nfor its argument '{info.name}' but its missing")
 
-            if optional:
-                if isinstance(value, type(None)):
+        if optional:
+            if isinstance(value, type(None)):
+                index += 1
+                continue
+            elif isinstance(value, str):
+                if value.lower() == 'none':
+                    value = None
+                    args[index] = value
                     index += 1
                     continue
-                elif isinstance(value, str):
-                    if value.lower() == 'none':
-                        value = None
-                        args[index] = value
-                        index += 1
-                        continue
-
 
-            if not isinstance(value, argType):
-                if issubclass(argType, bool):
-                    #Special conversion to bool
-                    if value.lower() in ['true', '1']:
-                        value = True
 
-                    elif value.lower() in ['false', '0']:
-                        value = False
+        if not isinstance(value, argType):
+            if issubclass(argType, bool):
+                #Special conversion to bool
+                if value.lower() in ['true', '1']:
+                    value = True
 
-                    else:
-                        value = bool(value)
-                        if warn:
-                        # warning here spam the console if called from rules.py, might be worth to make it a data validation instead
-                            logging.warn(f"A call of the {func.__name__} function in '{areaName}'s requirement, asks for a value of type {argType}\nfor its argument '{info.name}' but an unknown string was passed and thus converted to {value}")
+                elif value.lower() in ['false', '0']:
+                    value = False
 
                 else:
-                    try:
-                        value = argType(value)
+                    value = bool(value)
+                    if warn:
+                    # warning here spam the console if called from rules.py, might be worth to make it a data validation instead
+                        logging.warn(f"A call of the {func.__name__} function in '{areaName}'s requirement, asks for a value of type {argType}\nfor its argument '{info.name}' but an unknown string was passed and thus converted to {value}")
+
+            else:
+                try:
+                    value = argType(value)
 
-                    except ValueError:
-                        raise Exception(f"A call of the {func.__name__} function in '{areaName}'s requirement, asks for a value of type {argType}\nfor its argument '{info.name}' but its value '{value}' cannot be converted to {argType}")
+                except ValueError:
+                    raise Exception(f"A call of the {func.__name__} function in '{areaName}'s requirement, asks for a value of type {argType}\nfor its argument '{info.name}' but its value '{value}' cannot be converted to {argType}")
 
-                args[index] = value
+            args[index] = value
 
-            index += 1
+        index += 1
 
 def ItemValue(world: World, multiworld: MultiWorld, state: CollectionState, player: int, valueCount: str, skipCache: bool = False):
     """When passed a string with this format: 'valueName:int',
@@ -371,6 +407,8 @@ def ItemValue(world: World, multiworld: MultiWorld, state: CollectionState, play
     if (skipCache or world.item_values_cache[player][value_name].get('count', -1) == -1
             or world.item_values_cache[player][value_name].get('state') != dict(state.prog_items[player])):
         # Run First Time, if state changed since last check or if skipCache has a value
+        if world.generation_profile is not None:
+            world.generation_profile.count("item_value_recomputes")
         existing_item_values = get_items_with_value(world, multiworld, value_name)
         total_Count = 0
         for name, value in existing_item_values.items():
@@ -412,8 +450,7 @@ def OptOne(world: World, multiworld: MultiWorld, state: CollectionState, player:
     if require_type == 'category':
         if item_count.isnumeric():
             #Only loop if we can use the result to clamp
-            category_items = [item for item in world.item_name_to_item.values() if "category" in item and item_name in item["category"]]
-            category_items_counts = sum([items_counts.get(category_item["name"], 0) for category_item in category_items])
+            category_items_counts = sum([items_counts.get(category_item_name, 0) for category_item_name in world.item_category_to_names.get(item_name, [])])
             item_count = clamp(int(item_count), 0, category_items_counts)
         return f"|@{item_name}:{item_count}|"
     elif require_type == 'item':
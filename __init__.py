@@ -2,9 +2,15 @@ from base64 import b64encode
 import logging
 import os
 import json
+import time
+from collections import Counter
 from typing import Callable, Optional
 
 import Utils
+
+# the start of the import of the apworld, for the import profile (see Profiling.py)
+import_start = time.perf_counter()
+
 from worlds.generic.Rules import forbid_items_for_player
 from worlds.LauncherComponents import Component, SuffixIdentifier, components, Type, launch_subprocess
 
@@ -12,16 +18,15 @@ from .Data import item_table, location_table, region_table, category_table, meta
 from .Game import game_name, filler_item_name, starting_items
 from .Meta import world_description, world_webworld, enable_region_diagram
 from .Locations import location_id_to_name, location_name_to_id, location_name_to_location, location_name_groups, victory_names
-from .Items import item_id_to_name, item_name_to_id, item_name_to_item, item_name_groups
+from .Items import item_id_to_name, item_name_to_id, item_name_to_item, item_name_groups, item_category_to_names, item_name_to_category_counters
 from .DataValidation import runGenerationDataValidation, runPreFillDataValidation
 
-from .Regions import create_regions
 from .Items import ManualItem
-from .Rules import set_rules
 from .Options import manual_options_data
-from .Helpers import is_item_enabled, get_option_value, get_items_for_player, resolve_yaml_option
+from .Helpers import is_item_enabled, get_option_value, get_item_counts_by_player, resolve_yaml_option
+from .Profiling import GenerationProfile, profiling_enabled, profiled, profiled_hook, report_import_profile
 
-from BaseClasses import ItemClassification, Tutorial, Item
+from BaseClasses import ItemClassification, Tutorial, Item, CollectionState, MultiWorld
 from Options import PerGameCommonOptions
 from worlds.AutoWorld import World, WebWorld
 
@@ -35,6 +40,20 @@ from .hooks.World import \
     before_extend_hint_information, after_extend_hint_information
 from .hooks.Data import hook_interpret_slot_data
 
+# when profiling, the hooks of the stages up to the fill are timed too (see Profiling.py)
+hook_get_filler_item_name = profiled_hook(hook_get_filler_item_name)
+before_create_regions = profiled_hook(before_create_regions)
+after_create_regions = profiled_hook(after_create_regions)
+before_create_items_starting = profiled_hook(before_create_items_starting)
+before_create_items_filler = profiled_hook(before_create_items_filler)
+after_create_items = profiled_hook(after_create_items)
+before_create_item = profiled_hook(before_create_item)
+after_create_item = profiled_hook(after_create_item)
+before_set_rules = profiled_hook(before_set_rules)
+after_set_rules = profiled_hook(after_set_rules)
+before_generate_basic = profiled_hook(before_generate_basic)
+after_generate_basic = profiled_hook(after_generate_basic)
+
 class ManualWorld(World):
     __doc__ = world_description
     game: str = game_name
@@ -53,10 +72,11 @@ class ManualWorld(World):
     item_name_to_id = item_name_to_id
     item_name_to_item = item_name_to_item
     item_name_groups = item_name_groups
+    item_category_to_names = item_category_to_names
+    item_name_to_category_counters = item_name_to_category_counters
 
     filler_item_name = filler_item_name
 
-    item_counts = {}
     start_inventory = {}
 
     location_id_to_name = location_id_to_name
@@ -65,6 +85,10 @@ class ManualWorld(World):
     location_name_groups = location_name_groups
     victory_names = victory_names
 
+    def __init__(self, multiworld: MultiWorld, player: int):
+        super().__init__(multiworld, player)
+        self.generation_profile: Optional[GenerationProfile] = GenerationProfile() if profiling_enabled else None
+
     def get_filler_item_name(self) -> str:
         return hook_get_filler_item_name(self, self.multiworld, self.player) or self.filler_item_name
 
@@ -85,22 +109,25 @@ class ManualWorld(World):
         runGenerationDataValidation()
 
 
+    @profiled
     def create_regions(self):
+        # Regions and Rules are only imported once a generation needs them, so the launcher and the client don't load them
+        from .Regions import create_regions
+
         before_create_regions(self, self.multiworld, self.player)
 
         create_regions(self, self.multiworld, self.player)
 
+        # the other victory locations are never created, see create_regions in Regions.py
         location_game_complete = self.multiworld.get_location(victory_names[get_option_value(self.multiworld, self.player, 'goal')], self.player)
         location_game_complete.address = None
 
-        for unused_goal in [self.multiworld.get_location(name, self.player) for name in victory_names if name != location_game_complete.name]:
-            unused_goal.parent_region.locations.remove(unused_goal)
-
         location_game_complete.place_locked_item(
             ManualItem("__Victory__", ItemClassification.progression, None, player=self.player))
 
         after_create_regions(self, self.multiworld, self.player)
 
+    @profiled
     def create_items(self):
         # Generate item pool
         pool = []
@@ -114,14 +141,14 @@ class ManualWorld(World):
             if name == filler_item_name: continue # intentionally using the Game.py filler_item_name here because it's a non-Items item
 
             item = self.item_name_to_item[name]
-            item_count = int(item.get("count", 1))
+            item_count = int(item.count if item.count is not None else 1)
 
-            if item.get("trap"):
+            if item.trap:
                 traps.append(name)
 
-            if "category" in item:
-                if not is_item_enabled(self.multiworld, self.player, item):
-                    item_count = 0
+            # category is always there on the item records, so every item goes through is_item_enabled
+            if not is_item_enabled(self.multiworld, self.player, item):
+                item_count = 0
 
             if item_count == 0: continue
 
@@ -129,29 +156,29 @@ class ManualWorld(World):
                 new_item = self.create_item(name)
                 pool.append(new_item)
 
-            if item.get("early"): # Some or all early
-                if isinstance(item["early"],int) or (isinstance(item["early"],str) and item["early"].isnumeric()):
-                    self.multiworld.early_items[self.player][name] = int(item["early"])
+            if item.early: # Some or all early
+                if isinstance(item.early,int) or (isinstance(item.early,str) and item.early.isnumeric()):
+                    self.multiworld.early_items[self.player][name] = int(item.early)
 
-                elif isinstance(item["early"],bool): #No need to deal with true vs false since false wont get here
+                elif isinstance(item.early,bool): #No need to deal with true vs false since false wont get here
                     self.multiworld.early_items[self.player][name] = item_count
 
                 else:
-                    raise Exception(f"Item {name}'s 'early' has an invalid value of '{item['early']}'. \nA boolean or an integer was expected.")
+                    raise Exception(f"Item {name}'s 'early' has an invalid value of '{item.early}'. \nA boolean or an integer was expected.")
 
-            if item.get("local"): # All local
+            if item.local: # All local
                 if name not in self.options.local_items.value:
                     self.options.local_items.value.add(name)
 
-            if item.get("local_early"): # Some or all local and early
-                if isinstance(item["local_early"],int) or (isinstance(item["local_early"],str) and item["local_early"].isnumeric()):
-                    self.multiworld.local_early_items[self.player][name] = int(item["local_early"])
+            if item.local_early: # Some or all local and early
+                if isinstance(item.local_early,int) or (isinstance(item.local_early,str) and item.local_early.isnumeric()):
+                    self.multiworld.local_early_items[self.player][name] = int(item.local_early)
 
-                elif isinstance(item["local_early"],bool):
+                elif isinstance(item.local_early,bool):
                     self.multiworld.local_early_items[self.player][name] = item_count
 
                 else:
-                    raise Exception(f"Item {name}'s 'local_early' has an invalid value of '{item['local_early']}'. \nA boolean or an integer was expected.")
+                    raise Exception(f"Item {name}'s 'local_early' has an invalid value of '{item.local_early}'. \nA boolean or an integer was expected.")
 
 
         pool = before_create_items_starting(pool, self, self.multiworld, self.player)
@@ -179,7 +206,7 @@ class ManualWorld(World):
 
                 # if the setting lists specific item categories, limit the items to ones that have any of those categories
                 if "item_categories" in starting_item_block:
-                    items_in_categories = [item["name"] for item in self.item_name_to_item.values() if "category" in item and len(set(starting_item_block["item_categories"]).intersection(item["category"])) > 0]
+                    items_in_categories = [item.name for item in self.item_name_to_item.values() if len(set(starting_item_block["item_categories"]).intersection(item.category)) > 0]
                     items = [item for item in pool if item.name in items_in_categories]
 
                 self.random.shuffle(items)
@@ -193,7 +220,7 @@ class ManualWorld(World):
                     self.multiworld.push_precollected(starting_item)
                     pool.remove(starting_item)
 
-        self.start_inventory = {i.name: items_started.count(i) for i in items_started}
+        self.start_inventory = dict(Counter(i.name for i in items_started))
 
         pool = before_create_items_filler(pool, self, self.multiworld, self.player)
         pool = self.adjust_filler_items(pool, traps)
@@ -203,22 +230,26 @@ class ManualWorld(World):
         # then will remove specific item placements below from the overall pool
         self.multiworld.itempool += pool
 
+        # the pool is final now, so anything a hook counted before this point is outdated
+        self.invalidate_item_counts()
+
+    @profiled
     def create_item(self, name: str) -> Item:
         name = before_create_item(name, self, self.multiworld, self.player)
 
         item = self.item_name_to_item[name]
         classification = ItemClassification.filler
 
-        if "trap" in item and item["trap"]:
+        if item.trap:
             classification = ItemClassification.trap
 
-        if "useful" in item and item["useful"]:
+        if item.useful:
             classification = ItemClassification.useful
 
-        if "progression" in item and item["progression"]:
+        if item.progression:
             classification = ItemClassification.progression
 
-        if "progression_skip_balancing" in item and item["progression_skip_balancing"]:
+        if item.progression_skip_balancing:
             classification = ItemClassification.progression_skip_balancing
 
         item_object = ManualItem(name, classification,
@@ -228,79 +259,110 @@ class ManualWorld(World):
 
         return item_object
 
+    def collect(self, state: CollectionState, item: Item) -> bool:
+        change = super().collect(state, item)
+        if change:
+            # keep a running total per category so |@Category:N| requires are a single lookup
+            for category_counter in self.item_name_to_category_counters.get(item.name, ()):
+                state.prog_items[self.player][category_counter] += 1
+        return change
+
+    def remove(self, state: CollectionState, item: Item) -> bool:
+        change = super().remove(state, item)
+        if change:
+            for category_counter in self.item_name_to_category_counters.get(item.name, ()):
+                state.prog_items[self.player][category_counter] -= 1
+                if state.prog_items[self.player][category_counter] < 1:
+                    del state.prog_items[self.player][category_counter]
+        return change
+
+    @profiled
     def set_rules(self):
+        from .Rules import set_rules
+
         before_set_rules(self, self.multiworld, self.player)
 
         set_rules(self, self.multiworld, self.player)
 
         after_set_rules(self, self.multiworld, self.player)
 
+    @profiled
     def generate_basic(self):
         before_generate_basic(self, self.multiworld, self.player)
 
+        # the slot's locations by name, made here since the hooks above can add or remove locations
+        name_to_location = {location.name: location for location in self.multiworld.get_locations(self.player)}
+
+        # The names of the items listed and of the items in the categories listed, as one frozenset per combination of lists,
+        # so the locations with the same lists share both the set and the work of making it
+        item_name_sets: dict[tuple, frozenset[str]] = {}
+
+        def getItemNames(item_names: Optional[list[str]], item_categories: Optional[list[str]]) -> frozenset[str]:
+            key = (tuple(item_names or ()), tuple(item_categories or ()))
+            if key not in item_name_sets:
+                names = {name for name in key[0] if name in item_name_to_item}
+                for category in key[1]:
+                    names.update(item_category_to_names.get(category, ()))
+                item_name_sets[key] = frozenset(names)
+            return item_name_sets[key]
+
         # Handle item forbidding
-        manual_locations_with_forbid = {location['name']: location for location in location_name_to_location.values() if "dont_place_item" in location or "dont_place_item_category" in location}
-        locations_with_forbid = [l for l in self.multiworld.get_unfilled_locations(player=self.player) if l.name in manual_locations_with_forbid.keys()]
+        manual_locations_with_forbid = {location.name: location for location in location_name_to_location.values() if location.dont_place_item is not None or location.dont_place_item_category is not None}
+        locations_with_forbid = [name_to_location[name] for name in manual_locations_with_forbid if name in name_to_location]
+        locations_with_forbid = [location for location in locations_with_forbid if location.item is None]
         for location in locations_with_forbid:
             manual_location = manual_locations_with_forbid[location.name]
-            forbidden_item_names = []
-
-            if manual_location.get("dont_place_item"):
-                forbidden_item_names.extend([i["name"] for i in item_name_to_item.values() if i["name"] in manual_location["dont_place_item"]])
-
-            if manual_location.get("dont_place_item_category"):
-                forbidden_item_names.extend([i["name"] for i in item_name_to_item.values() if "category" in i and set(i["category"]).intersection(manual_location["dont_place_item_category"])])
+            forbidden_item_names = getItemNames(manual_location.dont_place_item, manual_location.dont_place_item_category)
 
             if forbidden_item_names:
-                forbid_items_for_player(location, set(forbidden_item_names), self.player)
+                forbid_items_for_player(location, forbidden_item_names, self.player)
 
         # Handle specific item placements using fill_restrictive
-        manual_locations_with_placements = {location['name']: location for location in location_name_to_location.values() if "place_item" in location or "place_item_category" in location}
-        locations_with_placements = [l for l in self.multiworld.get_unfilled_locations(player=self.player) if l.name in manual_locations_with_placements.keys()]
-        for location in locations_with_placements:
-            manual_location = manual_locations_with_placements[location.name]
-            eligible_items = []
-            eligible_item_names = []
-            forbidden_item_names = []
-            place_messages = []
-            forbid_messages = []
-
-            #First we get possible items names
-            if manual_location.get("place_item"):
-                eligible_item_names += manual_location["place_item"]
-                place_messages.append('", "'.join(manual_location["place_item"]))
-
-            if manual_location.get("place_item_category"):
-                eligible_item_names += [i["name"] for i in item_name_to_item.values() if "category" in i and set(i["category"]).intersection(manual_location["place_item_category"])]
-                place_messages.append('", "'.join(manual_location["place_item_category"]) + " category(ies)")
-
-            # Second we check for forbidden items names
-            if manual_location.get("dont_place_item"):
-                forbidden_item_names += manual_location["dont_place_item"]
-                forbid_messages.append('", "'.join(manual_location["dont_place_item"]) + ' items')
-
-            if manual_location.get("dont_place_item_category"):
-                forbidden_item_names += [i["name"] for i in item_name_to_item.values() if "category" in i and set(i["category"]).intersection(manual_location["dont_place_item_category"])]
-                forbid_messages.append('", "'.join(manual_location["dont_place_item_category"]) + ' category(ies)')
-
-            # If we forbid some names, check for those in the possible names and remove them
-            if forbidden_item_names:
-                eligible_item_names = [name for name in eligible_item_names if name not in forbidden_item_names]
-
-            if eligible_item_names:
-                eligible_items = [item for item in self.multiworld.itempool if item.player == self.player and item.name in eligible_item_names]
-
-            if len(eligible_items) == 0:
-                nl = "\n"
-                if forbidden_item_names:
-                    raise Exception(f'Could not find a suitable item to place at "{manual_location["name"]}".\n    No items that match "{f"{nl}     or ".join(place_messages)}"\n    Maybe because of forbidden "{f"{nl}     or ".join(forbid_messages)}"')
-                raise Exception(f'Could not find a suitable item to place at "{manual_location["name"]}". \n    No items that match "{f"{nl}     or ".join(place_messages)}"')
-
-            item_to_place = self.random.choice(eligible_items)
-            location.place_locked_item(item_to_place)
-
-            # remove the item we're about to place from the pool so it isn't placed twice
-            self.multiworld.itempool.remove(item_to_place)
+        manual_locations_with_placements = {location.name: location for location in location_name_to_location.values() if location.place_item is not None or location.place_item_category is not None}
+        locations_with_placements = [l for l in name_to_location.values() if l.item is None and l.name in manual_locations_with_placements]
+        if locations_with_placements:
+            # this player's items of the pool by name, with their position in the pool,
+            # so each draw picks among the eligible items in pool order without going through the whole multiworld's pool
+            itempool = self.multiworld.itempool
+            pool_items_by_name: dict[str, list[tuple[int, Item]]] = {}
+            for position, item in enumerate(itempool):
+                if item.player == self.player:
+                    pool_items_by_name.setdefault(item.name, []).append((position, item))
+            placed_positions = set()
+
+            for location in locations_with_placements:
+                manual_location = manual_locations_with_placements[location.name]
+
+                eligible_item_names = getItemNames(manual_location.place_item, manual_location.place_item_category)
+                forbidden_item_names = getItemNames(manual_location.dont_place_item, manual_location.dont_place_item_category)
+                eligible_items = sorted(pool_item for name in eligible_item_names - forbidden_item_names for pool_item in pool_items_by_name.get(name, ()))
+
+                if len(eligible_items) == 0:
+                    place_messages = []
+                    forbid_messages = []
+                    if manual_location.place_item:
+                        place_messages.append('", "'.join(manual_location.place_item))
+                    if manual_location.place_item_category:
+                        place_messages.append('", "'.join(manual_location.place_item_category) + " category(ies)")
+                    if manual_location.dont_place_item:
+                        forbid_messages.append('", "'.join(manual_location.dont_place_item) + ' items')
+                    if manual_location.dont_place_item_category:
+                        forbid_messages.append('", "'.join(manual_location.dont_place_item_category) + ' category(ies)')
+
+                    nl = "\n"
+                    if forbid_messages:
+                        raise Exception(f'Could not find a suitable item to place at "{manual_location.name}".\n    No items that match "{f"{nl}     or ".join(place_messages)}"\n    Maybe because of forbidden "{f"{nl}     or ".join(forbid_messages)}"')
+                    raise Exception(f'Could not find a suitable item to place at "{manual_location.name}". \n    No items that match "{f"{nl}     or ".join(place_messages)}"')
+
+                pool_item = self.random.choice(eligible_items)
+                position, item_to_place = pool_item
+                location.place_locked_item(item_to_place)
+
+                # take the item we're about to place out of its bucket so it isn't placed twice, the pool is updated once at the end
+                pool_items_by_name[item_to_place.name].remove(pool_item)
+                placed_positions.add(position)
+
+            itempool[:] = [item for position, item in enumerate(itempool) if position not in placed_positions]
 
 
         after_generate_basic(self, self.multiworld, self.player)
@@ -310,10 +372,19 @@ class ManualWorld(World):
             from Utils import visualize_regions
             visualize_regions(self.multiworld.get_region("Menu", self.player), f"{self.game}_{self.player}.puml")
 
+    @profiled
     def pre_fill(self):
+        if self.generation_profile is not None:
+            # the fill is timed from here to post_fill, so it has every slot's pre_fill and the fill of the whole multiworld in it
+            self.generation_profile.start_fill()
+
         # DataValidation after all the hooks are done but before fill
         runPreFillDataValidation(self, self.multiworld)
 
+    def post_fill(self):
+        if self.generation_profile is not None:
+            self.generation_profile.end_fill()
+
     def fill_slot_data(self):
         slot_data = before_fill_slot_data({}, self, self.multiworld, self.player)
 
@@ -334,6 +405,10 @@ class ManualWorld(World):
         with open(os.path.join(output_directory, filename), 'wb') as f:
             f.write(b64encode(bytes(json.dumps(data), 'utf-8')))
 
+        if self.generation_profile is not None:
+            # every stage that's timed is done by now, the ones after this (and fill_slot_data, which can run at the same time) aren't timed
+            self.generation_profile.write(os.path.join(output_directory, f"{self.multiworld.get_out_file_name_base(self.player)}_Profile.json"))
+
     def write_spoiler(self, spoiler_handle):
         before_write_spoiler(self, self.multiworld, spoiler_handle)
 
@@ -343,10 +418,11 @@ class ManualWorld(World):
         for location in self.multiworld.get_locations(self.player):
             if not location.address:
                 continue
-            if "hint_entrance" in self.location_name_to_location[location.name]:
+            hint_entrance = self.location_name_to_location[location.name].hint_entrance
+            if hint_entrance is not None:
                 if self.player not in hint_data:
                     hint_data.update({self.player: {}})
-                hint_data[self.player][location.address] = self.location_name_to_location[location.name]["hint_entrance"]
+                hint_data[self.player][location.address] = hint_entrance
         
         after_extend_hint_information(hint_data, self, self.multiworld, self.player)
 
@@ -404,18 +480,25 @@ class ManualWorld(World):
         if player is None:
             player = self.player
 
-        if not self.item_counts.get(player, {}) or reset:
-            real_pool = get_items_for_player(self.multiworld, player, True)
-            self.item_counts[player] = {i.name: real_pool.count(i) for i in real_pool}
-        return self.item_counts.get(player)
+        # every player is counted in one pass, and the counts are kept on the multiworld so the other slots don't count them again
+        item_counts = getattr(self.multiworld, "manual_item_counts", None)
+        if reset or item_counts is None or player not in item_counts:
+            item_counts = get_item_counts_by_player(self.multiworld, True)
+            self.multiworld.manual_item_counts = item_counts
+        return item_counts.setdefault(player, Counter())
+
+    def invalidate_item_counts(self) -> None:
+        """Forget the counts from get_item_counts (of every slot, they are shared), so they get counted again the next time they are needed.
+        Requires using 'all', 'half' or a percentage keep the count they got when they were first checked."""
+        self.multiworld.manual_item_counts = None
 
     def client_data(self):
         return {
             "game": self.game,
             'player_name': self.multiworld.get_player_name(self.player),
             'player_id': self.player,
-            'items': self.item_name_to_item,
-            'locations': self.location_name_to_location,
+            'items': {name: item.copy() for name, item in self.item_name_to_item.items()},
+            'locations': {name: location.copy() for name, location in self.location_name_to_location.items()},
             # todo: extract connections out of multiworld.get_regions() instead, in case hooks have modified the regions.
             'regions': region_table,
             'categories': category_table
@@ -453,3 +536,5 @@ def add_client_to_launcher() -> None:
         components.append(VersionedComponent("Manual Client", "ManualClient", func=launch_client, version=version, file_identifier=SuffixIdentifier('.apmanual')))
 
 add_client_to_launcher()
+
+report_import_profile(time.perf_counter() - import_start)
@@ -1,5 +1,14 @@
-import csv
-import pkgutil
+# The "Gather N Medals" and "Goal (Gather N Medals)" locations are generated for every N up to this,
+# but only the ones for the slot's medal count are created during generation (see hooks/Helpers.py and hooks/World.py)
+MAX_MEDALS = 500
+
+def get_gather_location_name(medals: int) -> str:
+    return "Gather 1 Medal" if medals == 1 else f"Gather {medals} Medals"
+
+def get_goal_location_name(medals: int) -> str:
+    return "Goal (Gather 1 Medal)" if medals == 1 else f"Goal (Gather {medals} Medals)"
+
+gather_location_names = {get_gather_location_name(i) for i in range(1, MAX_MEDALS + 1)}
 
 # called after the game.json file has been loaded
 def after_load_game_file(game_table: dict) -> dict:
@@ -17,43 +26,32 @@ def after_load_progressive_item_file(progressive_item_table: list) -> list:
 # called after the locations.json file has been loaded, before any location loading or processing has occurred
 # if you need access to the locations after processing to add ids, etc., you should use the hooks in World.py
 def after_load_location_file(location_table: list) -> list:
-    location = {}
-    location["name"] = "Gather 1 Medal"
-    location["category"] = ["((~Objective~))"]
-    location["requires"] = "|@Medals:1|"
-    location_table.append(location)
-    for i in range(2, 501):
+    for i in range(1, MAX_MEDALS + 1):
         location = {}
-        location["name"] = f"Gather {i} Medals"
+        location["name"] = get_gather_location_name(i)
         location["category"] = ["((~Objective~))"]
         location["requires"] = f"|@Medals:{i}|"
         location_table.append(location)
 
-    location = {}
-    location["name"] = "Goal (Gather 1 Medal)"
-    location["category"] = ["((~Goal~))"]
-    location["requires"] = "|@Medals:1|"
-    location["victory"] = True
-    location_table.append(location)
-    for i in range(2, 501):
+    for i in range(1, MAX_MEDALS + 1):
         location = {}
-        location["name"] = f"Goal (Gather {i} Medals)"
+        location["name"] = get_goal_location_name(i)
         location["category"] = ["((~Goal~))"]
         location["requires"] = f"|@Medals:{i}|"
         location["victory"] = True
         location_table.append(location)
-    
-    csvFile = csv.DictReader(pkgutil.get_data(__name__, "locations.csv").decode().splitlines(), delimiter=',')
-    for line in csvFile:
-        if line["name"] == "":
+
+    # imported here because Data.py imports this file before defining them
+    from ..Data import ManualCSVFile, csv_list
+
+    locations_csv = ManualCSVFile("hooks/locations.csv", {
+        "name": str,
+        "category": csv_list,
+        "requires": lambda requires: requires or [],
+    })
+    for location in locations_csv.rows():
+        if location["name"] == "":
             continue
-        location = {}
-        location["name"] = line["name"]
-        location["category"] = line["category"].split("; ")
-        if line["requires"] != "":
-            location["requires"] = line["requires"]
-        else:
-            location["requires"] = []
         location_table.append(location)
     
     return location_table
@@ -1,22 +1,27 @@
 # Object classes from AP core, to represent an entire MultiWorld and this individual World that's part of it
-import random
 from worlds.AutoWorld import World
 from BaseClasses import MultiWorld, CollectionState
 
 # Object classes from Manual -- extending AP core -- representing items and locations that are used in generation
 from ..Items import ManualItem
-from ..Locations import ManualLocation
+from ..Locations import ManualLocation, victory_name_to_index
 
 # Raw JSON data from the Manual apworld, respectively:
 #          data/game.json, data/items.json, data/locations.json, data/regions.json
 #
 from ..Data import game_table, item_table, location_table, region_table
+from .Data import MAX_MEDALS, get_gather_location_name, get_goal_location_name
+from .Options import TANK_HERO_LIST, DAMAGE_HERO_LIST, SUPPORT_HERO_LIST
 
 # These helper methods allow you to determine if an option has been set, or what its value is, for any player in the multiworld
 from ..Helpers import is_option_enabled, get_option_value
 
+# These helper methods remove many items from the item pool or many locations from the world without scanning everything for each one
+from ..Helpers import remove_items_from_pool, remove_locations_by_name
+
 # calling logging.info("message") anywhere below in this file will output the message to both console and log file
 import logging
+from types import MappingProxyType
 
 ########################################################################################
 ## Order of method calls when the world generates:
@@ -32,78 +37,209 @@ import logging
 
 final_includes_ow2 = {}
 
-def manual_overwatch2_define_max_medals(multiworld: MultiWorld, player: int, print_log: bool):
-    TANK_HERO_AMOUNT = 14
-    DAMAGE_HERO_AMOUNT = 22
-    SUPPORT_HERO_AMOUNT = 14
-
-    enable_tank_heroes = get_option_value(multiworld, player, "include_tank_heroes")
-    aux_tank_amount = len(get_option_value(multiworld, player, "available_tank_heroes"))
-    if aux_tank_amount == 0: aux_tank_amount = TANK_HERO_AMOUNT
-    tank_amount = min(get_option_value(multiworld, player, "tank_heroes_amount"), aux_tank_amount) if enable_tank_heroes else 0
-
-    enable_damage_heroes = get_option_value(multiworld, player, "include_damage_heroes")
-    aux_damage_amount = len(get_option_value(multiworld, player, "available_damage_heroes"))
-    if aux_damage_amount == 0: aux_damage_amount = DAMAGE_HERO_AMOUNT
-    damage_amount = min(get_option_value(multiworld, player, "damage_heroes_amount"), aux_damage_amount) if enable_damage_heroes else 0
-
-    enable_support_heroes = get_option_value(multiworld, player, "include_support_heroes")
-    aux_support_amount = len(get_option_value(multiworld, player, "available_support_heroes"))
-    if aux_support_amount == 0: aux_support_amount = SUPPORT_HERO_AMOUNT
-    support_amount = min(get_option_value(multiworld, player, "support_heroes_amount"), aux_support_amount) if enable_support_heroes else 0
-
-    total_hero_amount = tank_amount + damage_amount + support_amount
-    ITE_heroes = total_hero_amount
-    
-    enable_hero_ko = get_option_value(multiworld, player, "enable_hero_elimination_checks")
-    hero_ko_amount = get_option_value(multiworld, player, "hero_elimination_check_amount")
-    LOC_hero_ko = hero_ko_amount*total_hero_amount if enable_hero_ko else 0
-    
+# The options the medal count of a slot is computed from, see manual_overwatch2_medal_count_formula
+MEDAL_COUNT_OPTIONS = [
+    "required_medal_percentage",
+    "include_tank_heroes", "tank_heroes_amount",
+    "include_damage_heroes", "damage_heroes_amount",
+    "include_support_heroes", "support_heroes_amount",
+    "enable_hero_elimination_checks", "hero_elimination_check_amount",
+    "include_deathmatch_checks", "deathmatch_check_amount",
+]
+
+def manual_overwatch2_medal_count_formula(values: dict, minimum, round_half_even) -> dict:
+    """Computes the hero amounts, item and location totals and medals from the values of MEDAL_COUNT_OPTIONS
+    (and the number of available heroes of each role). The values are either the numbers of one slot, or NumPy arrays
+    with the numbers of many slots, so the math functions are passed in: min and round or their NumPy counterparts."""
+    counts = {}
+    for role in ["tank", "damage", "support"]:
+        counts[f"{role}_amount"] = values[f"include_{role}_heroes"] * minimum(values[f"{role}_heroes_amount"], values[f"available_{role}_heroes"])
+
+    total_hero_amount = counts["tank_amount"] + counts["damage_amount"] + counts["support_amount"]
+    counts["ITE_heroes"] = total_hero_amount
+    counts["LOC_hero_ko"] = values["enable_hero_elimination_checks"] * values["hero_elimination_check_amount"] * total_hero_amount
+
     # Hero Mastery mode removed, no mastery items or locations
-    ITE_mastery = 0
-    LOC_mastery = 0
-    
-    enable_deathmatch = get_option_value(multiworld, player, "include_deathmatch_checks")
-    deathmatch_checks = get_option_value(multiworld, player, "deathmatch_check_amount")
-    if ((enable_deathmatch == 1) or (enable_deathmatch == 2)):
-        ITE_deathmatch = 1
-        LOC_deathmatch = deathmatch_checks
-    elif enable_deathmatch == 3:
-        ITE_deathmatch = 2
-        LOC_deathmatch = 2*deathmatch_checks
-    else:
-        ITE_deathmatch = 0
-        LOC_deathmatch = 0
-
-    LOC_wins = 18
-
-    ITE_total =            ITE_heroes  + ITE_deathmatch
-    LOC_total = LOC_wins + LOC_hero_ko + LOC_deathmatch
+    counts["ITE_mastery"] = 0
+    counts["LOC_mastery"] = 0
+
+    # 1 and 2 are solo or team deathmatch only, 3 is both
+    enable_deathmatch = values["include_deathmatch_checks"]
+    counts["ITE_deathmatch"] = (enable_deathmatch == 1) + (enable_deathmatch == 2) + 2 * (enable_deathmatch == 3)
+    counts["LOC_deathmatch"] = counts["ITE_deathmatch"] * values["deathmatch_check_amount"]
+
+    counts["LOC_wins"] = 18
+
+    counts["ITE_total"] =                      counts["ITE_heroes"]  + counts["ITE_deathmatch"]
+    counts["LOC_total"] = counts["LOC_wins"] + counts["LOC_hero_ko"] + counts["LOC_deathmatch"]
+
+    counts["max_medals"] = counts["LOC_total"] - counts["ITE_total"]
+    medals = round_half_even(counts["max_medals"] * values["required_medal_percentage"] / 100)
+    counts["medals"] = medals + (medals == 0) # at least 1 medal
+    return counts
+
+def manual_overwatch2_define_max_medals_for_slots(multiworld: MultiWorld, players: list[int]) -> dict[int, dict]:
+    """Computes the medal counts of all the given slots at once, with NumPy if it's installed, and returns them by player"""
+    hero_lists = {"tank": TANK_HERO_LIST, "damage": DAMAGE_HERO_LIST, "support": SUPPORT_HERO_LIST}
+
+    # one column per option, with a value per slot, in the order of players
+    slot_options = [multiworld.worlds[player].options for player in players]
+    columns = {option_name: [getattr(options, option_name).value for options in slot_options] for option_name in MEDAL_COUNT_OPTIONS}
+    for role, hero_list in hero_lists.items():
+        # an empty set of available heroes works the same as a complete one
+        columns[f"available_{role}_heroes"] = [len(getattr(options, f"available_{role}_heroes").value) or len(hero_list) for options in slot_options]
+
+    try:
+        import numpy
+    except ImportError:
+        numpy = None
+
+    if numpy is not None:
+        counts = manual_overwatch2_medal_count_formula({option_name: numpy.array(column, dtype=numpy.int64) for option_name, column in columns.items()},
+                                                       numpy.minimum, numpy.rint)
+        # the counts that don't depend on the options are single numbers, broadcast_to gives them a value per slot too
+        counts = {count_name: numpy.broadcast_to(values, len(players)).astype(numpy.int64).tolist() for count_name, values in counts.items()}
+        return {player: {count_name: values[i] for count_name, values in counts.items()} for i, player in enumerate(players)}
+
+    slot_counts = {}
+    for i, player in enumerate(players):
+        counts = manual_overwatch2_medal_count_formula({option_name: column[i] for option_name, column in columns.items()}, min, round)
+        slot_counts[player] = {count_name: int(value) for count_name, value in counts.items()}
+    return slot_counts
+
+def manual_overwatch2_get_medal_count(multiworld: MultiWorld, player: int) -> dict:
+    """Returns the medal count of the slot. The first call computes them for every Overwatch slot of the multiworld."""
+    world = multiworld.worlds[player]
+    if getattr(world, "medal_count", None) is None:
+        players = multiworld.get_game_players(world.game)
+        for slot_player, medal_count in manual_overwatch2_define_max_medals_for_slots(multiworld, players).items():
+            multiworld.worlds[slot_player].medal_count = medal_count
+
+    return world.medal_count
+
+def manual_overwatch2_define_max_medals(multiworld: MultiWorld, player: int, print_log: bool):
+    counts = manual_overwatch2_get_medal_count(multiworld, player)
 
     if print_log:
         logging.info(f"Manual Overwatch 2 - Medal Count for SlotID {player}:")
         logging.info(f"  HERO AMOUNT:")
-        logging.info(f"  - Tank:    {tank_amount:02d}")
-        logging.info(f"  - Damage:  {damage_amount:02d}")
-        logging.info(f"  - Support: {support_amount:02d}")
+        logging.info(f"  - Tank:    {counts['tank_amount']:02d}")
+        logging.info(f"  - Damage:  {counts['damage_amount']:02d}")
+        logging.info(f"  - Support: {counts['support_amount']:02d}")
         logging.info("")
         logging.info(f"  ITEMS:")
-        logging.info(f"  - Heroes:     {ITE_heroes}")
-        logging.info(f"  - Masteries:  {ITE_mastery:02d}")
-        logging.info(f"  - Deathmatch: {ITE_deathmatch:02d}")
-        logging.info(f"  - TOTAL:      {ITE_total:02d}")
+        logging.info(f"  - Heroes:     {counts['ITE_heroes']}")
+        logging.info(f"  - Masteries:  {counts['ITE_mastery']:02d}")
+        logging.info(f"  - Deathmatch: {counts['ITE_deathmatch']:02d}")
+        logging.info(f"  - TOTAL:      {counts['ITE_total']:02d}")
         logging.info("")
         logging.info(f"  LOCATIONS:")
-        logging.info(f"  - Generic wins: {LOC_wins:02d}")
-        logging.info(f"  - Eliminations: {LOC_hero_ko:02d}")
-        logging.info(f"  - Masteries:    {LOC_mastery:02d}")
-        logging.info(f"  - Deathmatch:   {LOC_deathmatch:02d}")
-        logging.info(f"  - TOTAL:        {LOC_total:02d}")
+        logging.info(f"  - Generic wins: {counts['LOC_wins']:02d}")
+        logging.info(f"  - Eliminations: {counts['LOC_hero_ko']:02d}")
+        logging.info(f"  - Masteries:    {counts['LOC_mastery']:02d}")
+        logging.info(f"  - Deathmatch:   {counts['LOC_deathmatch']:02d}")
+        logging.info(f"  - TOTAL:        {counts['LOC_total']:02d}")
         logging.info("")
-        logging.info(f"  MAX MEDALS: {LOC_total} - {ITE_total} = {LOC_total - ITE_total}")
+        logging.info(f"  MAX MEDALS: {counts['LOC_total']} - {counts['ITE_total']} = {counts['max_medals']}")
         logging.info(f"------------------------------------------------------")
-    
-    return LOC_total - ITE_total
+
+    return counts["max_medals"]
+
+# The options a slot's generation plan depends on, slots with the same values for all of them share the same plan
+GENERATION_PLAN_OPTIONS = [
+    "required_medal_percentage",
+    "include_tank_heroes", "available_tank_heroes", "tank_heroes_amount",
+    "include_damage_heroes", "available_damage_heroes", "damage_heroes_amount",
+    "include_support_heroes", "available_support_heroes", "support_heroes_amount",
+    "enable_hero_elimination_checks", "hero_elimination_check_amount",
+    "include_deathmatch_checks", "deathmatch_check_amount",
+]
+
+def manual_overwatch2_get_generation_plan(world: World, multiworld: MultiWorld, player: int) -> MappingProxyType:
+    """Returns the part of the slot's generation that only depends on its options: its medal count, the heroes it can pick from,
+    and the locations that go away depending on the picks. It's made once and shared by all the hooks of the slot,
+    and by the other slots with the same options, so it's read-only."""
+    if getattr(world, "generation_plan", None) is None:
+        fingerprint = []
+        for option_name in GENERATION_PLAN_OPTIONS:
+            value = get_option_value(multiworld, player, option_name)
+            fingerprint.append(tuple(sorted(value)) if isinstance(value, (set, frozenset, list)) else value)
+        fingerprint = tuple(fingerprint)
+
+        # kept on the multiworld, so a process that generates more than once doesn't reuse the plans of another multiworld
+        if not hasattr(multiworld, "manual_overwatch2_generation_plans"):
+            multiworld.manual_overwatch2_generation_plans = {}
+        generation_plans = multiworld.manual_overwatch2_generation_plans
+
+        if fingerprint not in generation_plans:
+            generation_plans[fingerprint] = manual_overwatch2_make_generation_plan(multiworld, player)
+        else:
+            logging.info(f"Manual Overwatch 2 - Medal Count for SlotID {player}: same options as SlotID {generation_plans[fingerprint]['player']}, {generation_plans[fingerprint]['medals']} medals")
+
+        world.generation_plan = generation_plans[fingerprint]
+
+    return world.generation_plan
+
+def manual_overwatch2_make_generation_plan(multiworld: MultiWorld, player: int) -> MappingProxyType:
+    MAX_HERO_KO_CHECKS = 6
+    MAX_DEATHMATCH_CHECKS = 6
+
+    max_medals = manual_overwatch2_define_max_medals(multiworld, player, True)
+    medals = manual_overwatch2_get_medal_count(multiworld, player)["medals"]
+
+    enable_hero_ko = is_option_enabled(multiworld, player, "enable_hero_elimination_checks")
+    hero_ko_checks = get_option_value(multiworld, player, "hero_elimination_check_amount")
+
+    heroes = {}
+    picked_hero_locations_to_remove = {}
+    unpicked_hero_locations_to_remove = {}
+    for role, role_option, all_heroes in [("tanks", "tank", TANK_HERO_LIST), ("damages", "damage", DAMAGE_HERO_LIST), ("supports", "support", SUPPORT_HERO_LIST)]:
+        if not is_option_enabled(multiworld, player, f"include_{role_option}_heroes"):
+            continue
+
+        # sorted, because the order of an option set isn't the same from one run to the next
+        available_heroes = tuple(sorted(get_option_value(multiworld, player, f"available_{role_option}_heroes"))) or tuple(all_heroes)
+        heroes[role] = MappingProxyType({
+            "all": tuple(all_heroes),
+            "available": available_heroes,
+            "amount": min(get_option_value(multiworld, player, f"{role_option}_heroes_amount"), len(available_heroes)),
+        })
+
+        for hero in all_heroes:
+            if enable_hero_ko:
+                picked_hero_locations_to_remove[hero] = tuple(f"{hero} - Get Eliminations ({i})" for i in range(hero_ko_checks+1, MAX_HERO_KO_CHECKS))
+                unpicked_hero_locations_to_remove[hero] = tuple(f"{hero} - Get Eliminations ({i})" for i in range(1, MAX_HERO_KO_CHECKS))
+            else:
+                picked_hero_locations_to_remove[hero] = ()
+                unpicked_hero_locations_to_remove[hero] = ()
+
+    deathmatch_locations_to_remove = []
+    include_deathmatch = get_option_value(multiworld, player, "include_deathmatch_checks")
+
+    if include_deathmatch > 0:
+        deathmatch_check_amount = get_option_value(multiworld, player, "deathmatch_check_amount")
+
+        include_solo_deathmatch = ((include_deathmatch == 1) or (include_deathmatch == 3))
+        include_team_deathmatch = ((include_deathmatch == 2) or (include_deathmatch == 3))
+
+        first_removed_check = deathmatch_check_amount+1 if include_solo_deathmatch else 1
+        for i in range(first_removed_check, MAX_DEATHMATCH_CHECKS):
+            deathmatch_locations_to_remove.append(f"Solo Deathmatch - Check {i}")
+
+        first_removed_check = deathmatch_check_amount+1 if include_team_deathmatch else 1
+        for i in range(first_removed_check, MAX_DEATHMATCH_CHECKS):
+            deathmatch_locations_to_remove.append(f"Team Deathmatch - Check {i}")
+
+    # read-only all the way down (tuples and mapping proxies), since slots with the same options share the plan
+    return MappingProxyType({
+        "player": player, # the first slot that used this plan, for the log
+        "max_medals": max_medals,
+        "medals": medals,
+        "heroes": MappingProxyType(heroes),
+        "picked_hero_locations_to_remove": MappingProxyType(picked_hero_locations_to_remove),
+        "unpicked_hero_locations_to_remove": MappingProxyType(unpicked_hero_locations_to_remove),
+        "deathmatch_locations_to_remove": tuple(deathmatch_locations_to_remove),
+    })
 
 # Use this function to change the valid filler items to be created to replace item links or starting items.
 # Default value is the `filler_item_name` from game.json
@@ -112,18 +248,13 @@ def hook_get_filler_item_name(world: World, multiworld: MultiWorld, player: int)
 
 # Called before regions and locations are created. Not clear why you'd want this, but it's here. Victory location is included, but Victory event is not placed yet.
 def before_create_regions(world: World, multiworld: MultiWorld, player: int):
-    max_medals = manual_overwatch2_define_max_medals(multiworld, player, True)
-    multiplier = get_option_value(multiworld, player, "required_medal_percentage")
-    medals = round(max_medals * multiplier / 100)
-    if medals == 0:
-        medals = 1
-    if medals == 1:
-        goal_index = world.victory_names.index(f"Goal (Gather 1 Medal)")
-    else:
-        goal_index = world.victory_names.index(f"Goal (Gather {medals} Medals)")
+    medals = manual_overwatch2_get_generation_plan(world, multiworld, player)["medals"]
+
+    # Only the gather and goal locations for this medal count get created
+    world.required_medals = medals
 
     # Set goal location
-    world.options.goal.value = goal_index
+    world.options.goal.value = victory_name_to_index[get_goal_location_name(medals)]
 
 # Called after regions and locations are created, in case you want to see or modify that information. Victory location is included.
 def after_create_regions(world: World, multiworld: MultiWorld, player: int):
@@ -132,16 +263,12 @@ def after_create_regions(world: World, multiworld: MultiWorld, player: int):
 
     # Add your code here to calculate which locations to remove
 
-    for region in multiworld.regions:
-        if region.player == player:
-            for location in list(region.locations):
-                if location.name in locationNamesToRemove:
-                    region.locations.remove(location)
-    if hasattr(multiworld, "clear_location_cache"):
-        multiworld.clear_location_cache()
+    remove_locations_by_name(multiworld, player, locationNamesToRemove)
 
 # The item pool before starting items are processed, in case you want to see the raw item pool at that stage
 def before_create_items_starting(item_pool: list, world: World, multiworld: MultiWorld, player: int) -> list:
+    plan = manual_overwatch2_get_generation_plan(world, multiworld, player)
+
     final_includes_ow2[player] = {
         'tanks':[],
         'damages':[],
@@ -151,279 +278,49 @@ def before_create_items_starting(item_pool: list, world: World, multiworld: Mult
     locationNamesToRemove = [] # List of location names
     itemNamesToRemove = [] # List of item names
 
-    MAX_HERO_KO_CHECKS = 6
-    enable_hero_ko = is_option_enabled(multiworld, player, "enable_hero_elimination_checks")
-    hero_ko_checks = get_option_value(multiworld, player, "hero_elimination_check_amount")
+    hero_list = []
+    for role, role_heroes in plan["heroes"].items():
+        # a single draw from world.random, so the same seed and options always pick the same heroes
+        picked_heroes = world.random.sample(role_heroes["available"], role_heroes["amount"])
+        final_includes_ow2[player][role].extend(picked_heroes)
+        hero_list.extend(picked_heroes)
 
+        for hero in picked_heroes:
+            locationNamesToRemove.extend(plan["picked_hero_locations_to_remove"][hero])
 
+        for hero in role_heroes["all"]:
+            if hero in picked_heroes:
+                continue
 
-    include_tanks = is_option_enabled(multiworld, player, "include_tank_heroes")
-    include_damages = is_option_enabled(multiworld, player, "include_damage_heroes")
-    include_supports = is_option_enabled(multiworld, player, "include_support_heroes")
-
-
-    #Handling Tank list
-    tank_list = []
-    if include_tanks is True:
-        all_tank_list = [
-            "DVa",
-            "Doomfist",
-            "Hazard",
-            "Junker Queen",
-            "Mauga",
-            "Orisa",
-            "Ramattra",
-            "Reinhardt",
-            "Roadhog",
-            "Sigma",
-            "Winston",
-            "Wrecking Ball",
-            "Zarya",
-            "Domina"
-        ]
-
-        available_tank_list = []
-        if len(get_option_value(multiworld, player, "available_tank_heroes")) > 0:
-            available_tank_list.extend(get_option_value(multiworld, player, "available_tank_heroes"))
-        else:
-            available_tank_list.extend(all_tank_list)
-        
-        num_included_tanks = min(get_option_value(multiworld, player, "tank_heroes_amount"), len(available_tank_list))
-        
-        for _ in range(num_included_tanks):
-            st_hero = random.choice(list(available_tank_list))
-
-            final_includes_ow2[player]['tanks'].append(st_hero)
-            tank_list.append(st_hero)
-
-            available_tank_list.remove(st_hero)
-            all_tank_list.remove(st_hero)
-
-            if enable_hero_ko is True:
-                for i in range(hero_ko_checks+1, MAX_HERO_KO_CHECKS):
-                    locationNamesToRemove.append(f"{st_hero} - Get Eliminations ({i})")
-        
-        for hero in all_tank_list:
-            item = next(i for i in item_pool if i.name == hero)
-            item_pool.remove(item)
-
-            if enable_hero_ko is True:
-                locationNamesToRemove.append(f"{hero} - Get Eliminations (1)")
-                locationNamesToRemove.append(f"{hero} - Get Eliminations (2)")
-                locationNamesToRemove.append(f"{hero} - Get Eliminations (3)")
-                locationNamesToRemove.append(f"{hero} - Get Eliminations (4)")
-                locationNamesToRemove.append(f"{hero} - Get Eliminations (5)")    
-
-
-
-    #Handling Damage list
-    damage_list = []
-    if include_damages is True:
-        all_damage_list = [
-            "Ashe",
-            "Bastion",
-            "Cassidy",
-            "Echo",
-            "Freja",
-            "Genji",
-            "Hanzo",
-            "Junkrat",
-            "Mei",
-            "Pharah",
-            "Reaper",
-            "Sojourn",
-            "Soldier 76",
-            "Sombra",
-            "Symmetra",
-            "Torbjorn",
-            "Tracer",
-            "Venture",
-            "Widowmaker",
-            "Vendetta",
-            "Emre",
-            "Anran"
-        ]
-
-        available_damage_list = []
-        if len(get_option_value(multiworld, player, "available_damage_heroes")) > 0:
-            available_damage_list.extend(get_option_value(multiworld, player, "available_damage_heroes"))
-        else:
-            available_damage_list.extend(all_damage_list)
-        
-        num_included_damages = min(get_option_value(multiworld, player, "damage_heroes_amount"), len(available_damage_list))
-        
-        for _ in range(num_included_damages):
-            st_hero = random.choice(list(available_damage_list))
-
-            final_includes_ow2[player]['damages'].append(st_hero)
-            damage_list.append(st_hero)
-
-            available_damage_list.remove(st_hero)
-            all_damage_list.remove(st_hero)
-            
-            if enable_hero_ko is True:
-                for i in range(hero_ko_checks+1, MAX_HERO_KO_CHECKS):
-                    locationNamesToRemove.append(f"{st_hero} - Get Eliminations ({i})")
-                    
-        for hero in all_damage_list:
-            item = next(i for i in item_pool if i.name == hero)
-            item_pool.remove(item)
-
-            if enable_hero_ko is True:
-                locationNamesToRemove.append(f"{hero} - Get Eliminations (1)")
-                locationNamesToRemove.append(f"{hero} - Get Eliminations (2)")
-                locationNamesToRemove.append(f"{hero} - Get Eliminations (3)")
-                locationNamesToRemove.append(f"{hero} - Get Eliminations (4)")
-                locationNamesToRemove.append(f"{hero} - Get Eliminations (5)")     
-            
-    
-    #Handling Support list
-    support_list = []
-    if include_supports is True:
-        all_support_list = [
-            "Ana",
-            "Baptiste",
-            "Brigitte",
-            "Illari",
-            "Juno",
-            "Kiriko",
-            "Lifeweaver",
-            "Lucio",
-            "Mercy",
-            "Moira",
-            "Zenyatta",
-            # newly added support heroes
-            "Mizuki",
-            "Jetpack Cat",
-            "Wuyang"
-        ]
-
-        available_support_list = []
-        if len(get_option_value(multiworld, player, "available_support_heroes")) > 0:
-            available_support_list.extend(get_option_value(multiworld, player, "available_support_heroes"))
-        else:
-            available_support_list.extend(all_support_list)
-        
-        num_included_supports = min(get_option_value(multiworld, player, "support_heroes_amount"), len(available_support_list))
-        
-        for _ in range(num_included_supports):
-            st_hero = random.choice(list(available_support_list))
-
-            final_includes_ow2[player]['supports'].append(st_hero)
-            support_list.append(st_hero)
-
-            available_support_list.remove(st_hero)
-            all_support_list.remove(st_hero)
-
-            if enable_hero_ko is True:
-                for i in range(hero_ko_checks+1, MAX_HERO_KO_CHECKS):
-                    locationNamesToRemove.append(f"{st_hero} - Get Eliminations ({i})")
-        
-        for hero in all_support_list:
-            item = next(i for i in item_pool if i.name == hero)
-            item_pool.remove(item)
-
-            if enable_hero_ko is True:
-                locationNamesToRemove.append(f"{hero} - Get Eliminations (1)")
-                locationNamesToRemove.append(f"{hero} - Get Eliminations (2)")
-                locationNamesToRemove.append(f"{hero} - Get Eliminations (3)")
-                locationNamesToRemove.append(f"{hero} - Get Eliminations (4)")
-                locationNamesToRemove.append(f"{hero} - Get Eliminations (5)")   
+            itemNamesToRemove.append(hero)
+            locationNamesToRemove.extend(plan["unpicked_hero_locations_to_remove"][hero])
 
     num_starting_heroes = get_option_value(multiworld, player, "starting_hero_number")    
-    
-    hero_list = []
-    hero_list.extend(tank_list)
-    hero_list.extend(damage_list)
-    hero_list.extend(support_list)
-    
-    for _ in range(min(num_starting_heroes, len(hero_list))):
-        st_hero = random.choice(list(hero_list))
-        item = next(i for i in item_pool if i.name == st_hero)
-        item_pool.remove(item)
-        multiworld.push_precollected(item)
-        hero_list.remove(st_hero)
 
-    MAX_DEATHMATCH_CHECKS = 6
-    include_deathmatch = get_option_value(multiworld, player, "include_deathmatch_checks")
+    starting_hero_list = world.random.sample(hero_list, min(num_starting_heroes, len(hero_list)))
 
-    if include_deathmatch > 0:
-        deathmatch_check_amount = get_option_value(multiworld, player, "deathmatch_check_amount")
-
-        include_solo_deathmatch = ((include_deathmatch == 1) or (include_deathmatch == 3))
-        include_team_deathmatch = ((include_deathmatch == 2) or (include_deathmatch == 3))
+    for item in remove_items_from_pool(item_pool, starting_hero_list):
+        multiworld.push_precollected(item)
 
-        if include_solo_deathmatch:
-            for i in range(deathmatch_check_amount+1, MAX_DEATHMATCH_CHECKS):
-                    locationNamesToRemove.append(f"Solo Deathmatch - Check {i}")
-        else:
-            for i in range(1, MAX_DEATHMATCH_CHECKS):
-                locationNamesToRemove.append(f"Solo Deathmatch - Check {i}")
-        
-        if include_team_deathmatch:
-            for i in range(deathmatch_check_amount+1, MAX_DEATHMATCH_CHECKS):
-                    locationNamesToRemove.append(f"Team Deathmatch - Check {i}")
-        else:
-            for i in range(1, MAX_DEATHMATCH_CHECKS):
-                locationNamesToRemove.append(f"Team Deathmatch - Check {i}")
+    locationNamesToRemove.extend(plan["deathmatch_locations_to_remove"])
 
-    
+    medals = plan["medals"]
 
-    max_medals = manual_overwatch2_define_max_medals(multiworld, player, False)
-    multiplier = get_option_value(multiworld, player, "required_medal_percentage")
-    medals = round(max_medals * multiplier / 100)
-    if medals == 0:
-        medals = 1
-    
-    bad_medals = 500 - max_medals
-    for _ in range(bad_medals):
-        itemNamesToRemove.append("Medal")
+    bad_medals = MAX_MEDALS - plan["max_medals"]
+    itemNamesToRemove.extend(["Medal"] * bad_medals)
     
     # Get the victory item out of the pool:
-    victory_item = next(i for i in item_pool if i.name == "Ultimate Medal (Victory)")
-    item_pool.remove(victory_item)
+    victory_item = remove_items_from_pool(item_pool, ["Ultimate Medal (Victory)"])[0]
 
-    gather_loc_list = []
     if not hasattr(world.multiworld, "generation_is_fake"):
-        # Get the victory location and place the victory item there
-        gather_loc_list = ["Gather 1 Medal"] # A list of all the victory location names in order
-        for i in range(2, 501):
-            gather_loc_list.append(f"Gather {i} Medals")
-        
-        for i in range(len(gather_loc_list)):
-            if str(medals) in gather_loc_list[i]:
-                victory_id = i
-                break
-
-        gather_location_name = gather_loc_list[victory_id]
-        gather_location = next(l for l in multiworld.get_unfilled_locations(player=player) if l.name == gather_location_name)
+        # Get the victory location and place the victory item there, it's the only gather location that was created
+        gather_location = multiworld.get_location(get_gather_location_name(medals), player)
         gather_location.place_locked_item(victory_item)
     
-    # Remove the extra gather locations
-    for region in multiworld.regions:
-        if region.player == player:
-            for location in list(region.locations):
-                if location.name in gather_loc_list and location.name != gather_location_name:
-                    region.locations.remove(location)
-                    pass
-    
     # Remove items from the pool
-    debug = False
-    if debug:
-        print("Removing items from pool:")
-    for itemName in itemNamesToRemove:
-        if debug:
-            print(itemName)
-        item = next(i for i in item_pool if i.name == itemName)
-        item_pool.remove(item)
+    remove_items_from_pool(item_pool, itemNamesToRemove)
     
-    for region in multiworld.regions:
-        if region.player == player:
-            for location in list(region.locations):
-                if location.name in locationNamesToRemove:
-                    region.locations.remove(location)
-    if hasattr(multiworld, "clear_location_cache"):
-        multiworld.clear_location_cache()
+    remove_locations_by_name(multiworld, player, locationNamesToRemove)
 
     return item_pool
 
@@ -437,9 +334,7 @@ def before_create_items_filler(item_pool: list, world: World, multiworld: MultiW
     # Because multiple copies of an item can exist, you need to add an item name
     # to the list multiple times if you want to remove multiple copies of it.
 
-    for itemName in itemNamesToRemove:
-        item = next(i for i in item_pool if i.name == itemName)
-        item_pool.remove(item)
+    remove_items_from_pool(item_pool, itemNamesToRemove)
 
     return item_pool
 
@@ -0,0 +1,243 @@
+"""Generation benchmark for this Manual world.
+
+Run it from your Archipelago folder, with this apworld extracted into worlds/:
+    python -m worlds.<apworld folder>.manual_benchmark [--slots 1 10 50 200] [--seed 1] [--save-baseline]
+
+Every slot gets a random (but seeded) mix of options. The wall time of each generation stage and the peak memory
+are printed and compared to manual_benchmark_baselines.json. The stages are timed in a run without tracemalloc, and the
+peak memory comes from a second run of the same seed with tracemalloc, since it makes everything a few times slower.
+The import time of the apworld is measured too, in fresh interpreters with "python -X importtime".
+Any stage (or the import) that got much slower than its baseline is reported as a regression and the exit code is 1.
+
+The baselines depend on the machine, so none are shipped: the first run has to be made with --save-baseline,
+until then there is nothing to compare to.
+"""
+import argparse
+import json
+import logging
+import os
+import platform
+import random
+import subprocess
+import sys
+import time
+import tracemalloc
+from argparse import Namespace
+
+from BaseClasses import MultiWorld, CollectionState
+from Fill import distribute_items_restrictive
+from worlds.AutoWorld import World, call_all
+
+from . import ManualWorld
+from .Game import game_name
+
+baseline_file = os.path.join(os.path.dirname(__file__), "manual_benchmark_baselines.json")
+baseline_version = 3
+
+# The stages in the order Main runs them. connect_entrances only exists in newer Archipelago versions, and fill is Fill's, not a World method
+stages = ["generate_early", "create_regions", "create_items", "set_rules", "connect_entrances", "generate_basic", "pre_fill", "fill", "post_fill"]
+stages = [stage for stage in stages if stage == "fill" or hasattr(World, stage)]
+default_slot_counts = [1, 10, 50, 200]
+import_time_runs = 3 # the best of these is kept, the others are mostly noise from the disk cache
+
+# A stage is a regression when it's this many times slower than its baseline, and slower by more than min_regression_seconds
+regression_tolerance = 1.5
+min_regression_seconds = 0.05
+
+# The options that get a random value for each slot, the rest keep their default.
+# enable_hero_elimination_checks stays on, without those checks most hero mixes have more items than locations
+randomized_options = [
+    "required_medal_percentage", "starting_hero_number",
+    "include_tank_heroes", "tank_heroes_amount",
+    "include_damage_heroes", "damage_heroes_amount",
+    "include_support_heroes", "support_heroes_amount",
+    "hero_elimination_check_amount",
+    "include_deathmatch_checks", "deathmatch_check_amount",
+]
+
+def random_options(rng: random.Random) -> dict[str, int]:
+    """Pick a random value for each option in randomized_options, based on the option's own range or choices"""
+    options = {}
+    for option_name in randomized_options:
+        option = ManualWorld.options_dataclass.type_hints[option_name]
+
+        if hasattr(option, "range_start"):
+            options[option_name] = rng.randint(option.range_start, option.range_end)
+        elif hasattr(option, "options"):
+            options[option_name] = rng.choice(sorted(set(option.options.values())))
+        else:
+            options[option_name] = rng.randint(0, 1)
+
+    # a slot without any hero is not something players can generate
+    if not (options["include_tank_heroes"] or options["include_damage_heroes"] or options["include_support_heroes"]):
+        options["include_damage_heroes"] = 1
+
+    return options
+
+def setup_multiworld(slot_count: int, seed: int) -> MultiWorld:
+    rng = random.Random(seed)
+
+    multiworld = MultiWorld(slot_count)
+    multiworld.game = {player: game_name for player in multiworld.player_ids}
+    multiworld.player_name = {player: f"Bench{player}" for player in multiworld.player_ids}
+    multiworld.set_seed(seed)
+    multiworld.state = CollectionState(multiworld)
+
+    args = Namespace()
+    for option_name, option in ManualWorld.options_dataclass.type_hints.items():
+        setattr(args, option_name, {player: option.from_any(option.default) for player in multiworld.player_ids})
+
+    for player in multiworld.player_ids:
+        for option_name, value in random_options(rng).items():
+            option = ManualWorld.options_dataclass.type_hints[option_name]
+            getattr(args, option_name)[player] = option.from_any(value)
+
+    multiworld.set_options(args)
+    return multiworld
+
+def generate(slot_count: int, seed: int) -> tuple[MultiWorld, dict[str, float]]:
+    """Generate a multiworld of slot_count slots of this world and return it with the time taken by each stage"""
+    random.seed(seed) # in case anything still uses the global random
+
+    start = time.perf_counter()
+    multiworld = setup_multiworld(slot_count, seed)
+    stage_times = {"setup": time.perf_counter() - start}
+
+    for stage in stages:
+        start = time.perf_counter()
+        if stage == "fill":
+            distribute_items_restrictive(multiworld)
+        else:
+            call_all(multiworld, stage)
+        stage_times[stage] = time.perf_counter() - start
+
+    return multiworld, stage_times
+
+def run_benchmark(slot_count: int, seed: int) -> dict:
+    """Return the time taken by each stage and the peak memory of generating slot_count slots of this world"""
+    multiworld, stage_times = generate(slot_count, seed)
+    location_count = len(multiworld.get_locations())
+    del multiworld
+
+    # tracemalloc slows everything down, so it only runs for a second generation of the same seed
+    tracemalloc.start()
+    generate(slot_count, seed)
+    _, peak_memory = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+
+    return {
+        "stages": stage_times,
+        "total": sum(stage_times.values()),
+        "peak_memory_mb": peak_memory / 1024 / 1024,
+        "locations": location_count,
+    }
+
+def measure_import_time() -> float|None:
+    """The time it takes to import this apworld (including what it imports) in a new interpreter, in seconds"""
+    best_time = None
+    for _ in range(import_time_runs):
+        process = subprocess.run([sys.executable, "-X", "importtime", "-c", f"import {__package__}"], capture_output=True, text=True)
+
+        # each line looks like "import time: <self us> | <cumulative us> | <module>"
+        for line in process.stderr.splitlines():
+            columns = line.split("|")
+            if len(columns) == 3 and columns[2].strip() == __package__:
+                import_time = int(columns[1]) / 1_000_000
+                best_time = import_time if best_time is None else min(best_time, import_time)
+                break
+
+    return best_time
+
+def load_baselines() -> dict:
+    if not os.path.exists(baseline_file):
+        return {}
+
+    with open(baseline_file, "r") as f:
+        baselines = json.load(f)
+
+    if baselines.get("version") != baseline_version:
+        logging.warning(f"Ignoring {baseline_file}, it was written by another version of the benchmark.")
+        return {}
+
+    return baselines
+
+def save_baselines(results: dict[int, dict], import_time: float|None, seed: int) -> None:
+    baselines = load_baselines() or {"version": baseline_version, "results": {}}
+    baselines["seed"] = seed
+    baselines["python"] = platform.python_version()
+    if import_time is not None:
+        baselines["import_seconds"] = import_time
+    for slot_count, result in results.items():
+        baselines["results"][str(slot_count)] = result
+
+    with open(baseline_file, "w") as f:
+        json.dump(baselines, f, indent=4, sort_keys=True)
+
+def find_regressions(slot_count: int, result: dict, baselines: dict) -> list[str]:
+    baseline = baselines.get("results", {}).get(str(slot_count))
+    if not baseline:
+        return []
+
+    regressions = []
+    for stage, seconds in result["stages"].items():
+        baseline_seconds = baseline["stages"].get(stage)
+        if baseline_seconds is None:
+            continue
+
+        if seconds > baseline_seconds * regression_tolerance and seconds - baseline_seconds > min_regression_seconds:
+            regressions.append(f"{slot_count} slots: {stage} took {seconds:.3f}s, its baseline is {baseline_seconds:.3f}s")
+
+    if result["peak_memory_mb"] > baseline["peak_memory_mb"] * regression_tolerance:
+        regressions.append(f"{slot_count} slots: peak memory was {result['peak_memory_mb']:.1f}MB, its baseline is {baseline['peak_memory_mb']:.1f}MB")
+
+    return regressions
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description=f"Benchmark the generation of {game_name}.")
+    parser.add_argument("--slots", type=int, nargs="+", default=default_slot_counts, help="The multiworld sizes to generate.")
+    parser.add_argument("--seed", type=int, default=1, help="Seed for the generation and for the option mix of each slot.")
+    parser.add_argument("--skip-import-time", action="store_true", help="Don't measure the import time of the apworld.")
+    parser.add_argument("--save-baseline", action="store_true", help=f"Save the results as the new baselines in {os.path.basename(baseline_file)}.")
+    args = parser.parse_args()
+
+    # the per-slot logging of the hooks would drown out the results
+    logging.getLogger().setLevel(logging.WARNING)
+
+    baselines = load_baselines()
+    if not baselines and not args.save_baseline:
+        logging.warning(f"There are no baselines in {baseline_file} to compare to, run the benchmark with --save-baseline first.")
+    elif baselines and baselines.get("seed") != args.seed:
+        logging.warning(f"The baselines were made with seed {baselines.get('seed')}, comparing them to seed {args.seed} is not meaningful.")
+
+    results = {}
+    regressions = []
+
+    import_time = None if args.skip_import_time else measure_import_time()
+    if import_time is not None:
+        print(f"Import: {import_time:.3f}s")
+        baseline_import_time = baselines.get("import_seconds")
+        if baseline_import_time and import_time > baseline_import_time * regression_tolerance and import_time - baseline_import_time > min_regression_seconds:
+            regressions.append(f"the import took {import_time:.3f}s, its baseline is {baseline_import_time:.3f}s")
+
+    for slot_count in args.slots:
+        result = run_benchmark(slot_count, args.seed)
+        results[slot_count] = result
+        regressions.extend(find_regressions(slot_count, result, baselines))
+
+        print(f"{slot_count} slots, {result['locations']} locations: {result['total']:.3f}s total, {result['peak_memory_mb']:.1f}MB peak memory")
+        for stage, seconds in result["stages"].items():
+            print(f"    {stage:<18}{seconds:.3f}s")
+
+    if args.save_baseline:
+        save_baselines(results, import_time, args.seed)
+        print(f"Saved the baselines to {baseline_file}")
+    elif regressions:
+        print("\nRegressions compared to the baselines:")
+        for regression in regressions:
+            print(f" - {regression}")
+        return 1
+
+    return 0
+
+if __name__ == "__main__":
+    sys.exit(main())
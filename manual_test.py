@@ -1,6 +1,202 @@
 from test.TestBase import WorldTestBase
+from .Data import ManualLocationData
 from .Game import game_name
+from .Helpers import remove_items_from_pool
+from .Rules import set_rules
+from .hooks.Data import get_gather_location_name, get_goal_location_name, gather_location_names
+from .hooks.Options import DAMAGE_HERO_LIST, SUPPORT_HERO_LIST
+
+import math
 
 
 class ManualTest(WorldTestBase):
     game = game_name
+
+
+class TestRequiresParsing(ManualTest):
+    options = {"starting_hero_number": 1}
+
+    def setUp(self):
+        super().setUp()
+        # two heroes from the item pool, so neither is in the starting inventory
+        self.hero, self.other_hero = [item.name for item in self.multiworld.itempool
+                                      if item.player == self.player and item.name in DAMAGE_HERO_LIST][:2]
+        self.medals = self.get_items_by_name("Medal")
+
+    def set_requires(self, requires: str) -> str:
+        """Compiles requires with set_rules as the rule of one of the slot's locations, and returns the location's name"""
+        location_name = "Win Control as Tank Role"
+        self.world.location_table = [ManualLocationData({"name": location_name, "requires": requires})]
+        try:
+            set_rules(self.world, self.multiworld, self.player)
+        finally:
+            del self.world.location_table
+        return location_name
+
+    def assertMedalsNeeded(self, requires: str, medal_count: int):
+        location_name = self.set_requires(requires)
+        self.collect(self.medals[:medal_count - 1])
+        self.assertFalse(self.can_reach_location(location_name), f"{requires} with {medal_count - 1} medals")
+        self.collect(self.medals[medal_count - 1:medal_count])
+        self.assertTrue(self.can_reach_location(location_name), f"{requires} with {medal_count} medals")
+
+    def test_and(self):
+        location_name = self.set_requires(f"|{self.hero}| AND |{self.other_hero}|")
+        self.collect_by_name(self.hero)
+        self.assertFalse(self.can_reach_location(location_name))
+        self.collect_by_name(self.other_hero)
+        self.assertTrue(self.can_reach_location(location_name))
+
+    def test_or(self):
+        location_name = self.set_requires(f"|{self.hero}| or |{self.other_hero}|")
+        self.assertFalse(self.can_reach_location(location_name))
+        self.collect_by_name(self.other_hero)
+        self.assertTrue(self.can_reach_location(location_name))
+
+    def test_not(self):
+        location_name = self.set_requires(f"!|{self.hero}|")
+        self.assertTrue(self.can_reach_location(location_name))
+        self.collect_by_name(self.hero)
+        self.assertFalse(self.can_reach_location(location_name))
+
+    def test_parentheses(self):
+        # AND and OR have the same precedence and apply left to right, parentheses change the grouping
+        left_to_right = self.set_requires(f"|{self.hero}| OR |{self.other_hero}| AND 0")
+        self.collect_by_name(self.hero)
+        self.assertFalse(self.can_reach_location(left_to_right))
+
+        grouped = self.set_requires(f"|{self.hero}| OR (|{self.other_hero}| AND 0)")
+        self.assertTrue(self.can_reach_location(grouped))
+
+        negated_group = self.set_requires(f"!(|{self.hero}| OR |{self.other_hero}|)")
+        self.assertFalse(self.can_reach_location(negated_group))
+
+    def test_invalid_requires(self):
+        for requires in [f"(|{self.hero}| AND |{self.other_hero}|", f"|{self.hero}| AND", f"|{self.hero}| |{self.other_hero}|", ")"]:
+            with self.subTest(requires=requires):
+                self.assertRaises(KeyError, self.set_requires, requires)
+
+    def test_item_count(self):
+        self.assertMedalsNeeded("|Medal:3|", 3)
+
+    def test_category_count(self):
+        self.assertMedalsNeeded("|@Medals:2|", 2)
+
+    def test_all(self):
+        self.assertMedalsNeeded("|Medal:all|", len(self.medals))
+
+    def test_half(self):
+        self.assertMedalsNeeded("|Medal:half|", len(self.medals) // 2)
+
+    def test_percent(self):
+        self.assertMedalsNeeded("|@Medals:30%|", math.ceil(len(self.medals) * 0.3))
+
+    def test_invalid_count(self):
+        self.assertRaises(ValueError, self.set_requires, "|Medal:many|")
+
+    def test_functions(self):
+        self.assertTrue(self.can_reach_location(self.set_requires("{YamlEnabled(include_damage_heroes)}")))
+        self.assertFalse(self.can_reach_location(self.set_requires("{YamlDisabled(include_damage_heroes)}")))
+
+        location_name = self.set_requires(f"{{YamlEnabled(include_damage_heroes)}} AND |{self.hero}|")
+        self.assertFalse(self.can_reach_location(location_name))
+        self.collect_by_name(self.hero)
+        self.assertTrue(self.can_reach_location(location_name))
+
+    def test_function_returning_requires(self):
+        # OptOne returns a requires string, with the count clamped to the medals in the pool
+        self.assertMedalsNeeded(f"{{OptOne(|Medal:{len(self.medals) + 10}|)}}", len(self.medals))
+
+    def test_invalid_function(self):
+        self.assertRaises(ValueError, self.set_requires, "{notARealFunction()}")
+
+
+class TestRemoveItemsFromPool(ManualTest):
+    def test_removes_one_copy_per_name(self):
+        item_pool = [self.world.create_item(item_name) for item_name in ["Medal", "Ana", "Medal", "Medal"]]
+        removed_items = remove_items_from_pool(item_pool, ["Medal", "Ana", "Medal"])
+
+        self.assertEqual([item.name for item in removed_items], ["Medal", "Ana", "Medal"])
+        self.assertEqual([item.name for item in item_pool], ["Medal"])
+
+    def test_missing_items(self):
+        item_pool = [self.world.create_item(item_name) for item_name in ["Medal", "Ana"]]
+
+        with self.assertRaises(ValueError):
+            remove_items_from_pool(item_pool, ["Ana", "Medal", "Medal"])
+        with self.assertRaises(ValueError):
+            remove_items_from_pool(item_pool, ["Mercy"])
+
+        # nothing is removed when an item is missing
+        self.assertEqual([item.name for item in item_pool], ["Medal", "Ana"])
+
+
+class TestMedalCount(ManualTest):
+    """The default options: the 50 heroes with 3 elimination checks each, no deathmatch and 70% of the medals.
+    Each subclass is another mix of options, with the numbers worked out by hand."""
+    max_medals = 18 + 50 * 3 - 50
+    medals = 83 # 70% of 118 is 82.6
+
+    def test_medal_count(self):
+        self.assertEqual(self.world.generation_plan["max_medals"], self.max_medals)
+        self.assertEqual(self.world.required_medals, self.medals)
+        self.assertEqual(len(self.get_items_by_name("Medal")), self.max_medals)
+
+    def test_gather_location(self):
+        gather_locations = [location for location in self.multiworld.get_locations(self.player) if location.name in gather_location_names]
+        self.assertEqual([location.name for location in gather_locations], [get_gather_location_name(self.medals)])
+        self.assertEqual(gather_locations[0].item.name, "Ultimate Medal (Victory)")
+
+        # raises if the goal location for the medal count wasn't created
+        self.multiworld.get_location(get_goal_location_name(self.medals), self.player)
+
+    def test_gather_location_needs_the_medals(self):
+        location_name = get_gather_location_name(self.medals)
+        medals = self.get_items_by_name("Medal")
+
+        self.collect(medals[:self.medals - 1])
+        self.assertFalse(self.can_reach_location(location_name))
+        self.collect(medals[self.medals - 1:self.medals])
+        self.assertTrue(self.can_reach_location(location_name))
+
+
+class TestMedalCountFewHeroes(TestMedalCount):
+    options = {
+        "tank_heroes_amount": 2,
+        "damage_heroes_amount": 3,
+        "support_heroes_amount": 1,
+        "hero_elimination_check_amount": 5,
+        "include_deathmatch_checks": 3, # both
+        "deathmatch_check_amount": 2,
+        "required_medal_percentage": 100,
+    }
+    # 18 wins, 6 heroes with 5 elimination checks each, 2 deathmatch items with 2 checks each
+    max_medals = (18 + 6 * 5 + 2 * 2) - (6 + 2)
+    medals = max_medals
+
+    def test_deathmatch_locations(self):
+        location_names = {location.name for location in self.multiworld.get_locations(self.player)}
+        for mode in ["Solo", "Team"]:
+            self.assertIn(f"{mode} Deathmatch - Check 2", location_names)
+            self.assertNotIn(f"{mode} Deathmatch - Check 3", location_names)
+
+
+class TestMedalCountAvailableHeroes(TestMedalCount):
+    options = {
+        "tank_heroes_amount": 1,
+        "damage_heroes_amount": 1,
+        "available_support_heroes": ["Ana", "Kiriko", "Mercy"],
+        "support_heroes_amount": 10,
+        "enable_hero_elimination_checks": False,
+        "include_deathmatch_checks": 3, # both
+        "deathmatch_check_amount": 1,
+        "required_medal_percentage": 50,
+    }
+    # the support amount is capped to the 3 available heroes, and without elimination checks heroes don't add any location
+    max_medals = (18 + 2 * 1) - (5 + 2)
+    medals = 6 # 50% of 13 is 6.5, rounded half to even
+
+    def test_only_available_heroes(self):
+        items = self.multiworld.itempool + self.multiworld.precollected_items[self.player]
+        support_heroes = {item.name for item in items if item.name in SUPPORT_HERO_LIST}
+        self.assertEqual(support_heroes, {"Ana", "Kiriko", "Mercy"})